@@ -16,6 +16,9 @@ Usage:
 """
 
 import logging
+import os
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from typing import List, Dict, Any, Optional
 import numpy as np
 
@@ -31,6 +34,80 @@ except ImportError:
     logger.warning("Gensim not available. Install with: pip install gensim")
 
 
+# Small LRU of dictionaries keyed by corpus identity, so repeated convenience
+# calls for the same corpus snapshot skip the O(total_tokens) rebuild. Each
+# entry pins its corpus list: a bare id() key could be reused by a new list
+# at the same address after the original is garbage-collected, so hits are
+# confirmed with an `is` check against the stored reference.
+_dictionary_cache = OrderedDict()
+_DICTIONARY_CACHE_SIZE = 8
+
+
+def _cached_dictionary(texts: List[List[str]]) -> 'Dictionary':
+    """
+    Build (or reuse) a Dictionary for a tokenized corpus.
+
+    Keyed by the list's identity. Callers that mutate their token lists in
+    place between calls should pass an explicit dictionary instead.
+    """
+    key = id(texts)
+    entry = _dictionary_cache.get(key)
+
+    if entry is not None and entry[0] is texts:
+        _dictionary_cache.move_to_end(key)
+        return entry[1]
+
+    dictionary = Dictionary(texts)
+    _dictionary_cache[key] = (texts, dictionary)
+    if len(_dictionary_cache) > _DICTIONARY_CACHE_SIZE:
+        _dictionary_cache.popitem(last=False)
+
+    return dictionary
+
+
+def _calc_one_metric(
+    texts: List[List[str]],
+    dictionary: 'Dictionary',
+    topics_truncated: List[List[str]],
+    num_topics: int,
+    topn: int,
+    metric: str
+) -> Dict[str, Any]:
+    """
+    Score a single coherence metric (module-level so it is picklable for
+    ProcessPoolExecutor workers). Uses processes=1 to avoid nested pools.
+    """
+    try:
+        cm = CoherenceModel(
+            topics=topics_truncated,
+            texts=texts,
+            dictionary=dictionary,
+            coherence=metric,
+            processes=1
+        )
+
+        coherence_score = cm.get_coherence()
+        per_topic_coherence = cm.get_coherence_per_topic()
+
+        return {
+            'coherence_score': float(coherence_score),
+            'per_topic_coherence': np.asarray(per_topic_coherence, dtype=np.float64).tolist(),
+            'coherence_type': metric,
+            'num_topics': num_topics,
+            'topn': topn
+        }
+
+    except Exception as e:
+        return {
+            'coherence_score': 0.0,
+            'per_topic_coherence': [0.0] * num_topics,
+            'coherence_type': metric,
+            'num_topics': num_topics,
+            'topn': topn,
+            'error': str(e)
+        }
+
+
 class CoherenceCalculator:
     """
     Calculates coherence scores for topic models.
@@ -39,6 +116,16 @@ class CoherenceCalculator:
     Higher scores indicate better topic quality.
     """
 
+    # Below this many documents, gensim's worker pool costs more in
+    # fork/pickle overhead than the coherence math itself; use a single process.
+    MULTIPROCESS_THRESHOLD = 200
+
+    # Sliding-window sizes gensim uses per metric; co-occurrence
+    # accumulators are only interchangeable between metrics that scan
+    # the same window. Metrics not listed here (u_mass) use
+    # document-level counts instead of a window.
+    WINDOW_SIZES = {'c_v': 110, 'c_npmi': 10, 'c_uci': 10}
+
     def __init__(
         self,
         texts: List[List[str]],
@@ -71,8 +158,18 @@ class CoherenceCalculator:
         else:
             self.dictionary = dictionary
 
+        # Cache the BoW corpus so document-level metrics (u_mass) can reuse it
+        # instead of re-scanning the raw texts. Costs one pass up front plus
+        # memory proportional to the total token count; sliding-window metrics
+        # still need the raw texts.
+        self.bow_corpus = [self.dictionary.doc2bow(text) for text in texts]
+
         logger.info(f"Coherence calculator initialized with {coherence_type} metric")
 
+    def _coherence_processes(self) -> int:
+        """Worker process count for CoherenceModel (1 = no pool for small corpora)."""
+        return 1 if len(self.texts) < self.MULTIPROCESS_THRESHOLD else 0
+
     def calculate_topic_coherence(
         self,
         topics: List[List[str]],
@@ -106,8 +203,12 @@ class CoherenceCalculator:
                 'topn': topn
             }
 
-        # Truncate topics to topn words
-        topics_truncated = [topic[:topn] for topic in topics]
+        # Truncate topics to topn words (skip the re-slice when every topic
+        # already fits, avoiding a new list per topic)
+        if all(len(topic) <= topn for topic in topics):
+            topics_truncated = topics
+        else:
+            topics_truncated = [topic[:topn] for topic in topics]
 
         logger.info(
             f"Calculating {self.coherence_type} coherence for {len(topics)} topics "
@@ -115,25 +216,38 @@ class CoherenceCalculator:
         )
 
         try:
-            # Calculate overall coherence
-            cm = CoherenceModel(
-                topics=topics_truncated,
-                texts=self.texts,
-                dictionary=self.dictionary,
-                coherence=self.coherence_type
-            )
+            # Calculate overall coherence (u_mass works on the cached BoW
+            # corpus; sliding-window metrics need the raw texts)
+            if self.coherence_type == 'u_mass':
+                cm = CoherenceModel(
+                    topics=topics_truncated,
+                    corpus=self.bow_corpus,
+                    dictionary=self.dictionary,
+                    coherence=self.coherence_type,
+                    processes=self._coherence_processes()
+                )
+            else:
+                cm = CoherenceModel(
+                    topics=topics_truncated,
+                    texts=self.texts,
+                    dictionary=self.dictionary,
+                    coherence=self.coherence_type,
+                    processes=self._coherence_processes()
+                )
 
             coherence_score = cm.get_coherence()
 
             # Calculate per-topic coherence
-            per_topic_coherence = cm.get_coherence_per_topic()
+            per_topic_arr = np.asarray(cm.get_coherence_per_topic(), dtype=np.float64)
 
-            logger.info(f"Overall coherence ({self.coherence_type}): {coherence_score:.4f}")
-            logger.info(f"Per-topic coherence range: [{min(per_topic_coherence):.4f}, {max(per_topic_coherence):.4f}]")
+            logger.info(
+                f"Overall coherence ({self.coherence_type}): {coherence_score:.4f}, "
+                f"per-topic range: [{per_topic_arr.min():.4f}, {per_topic_arr.max():.4f}]"
+            )
 
             return {
                 'coherence_score': float(coherence_score),
-                'per_topic_coherence': [float(score) for score in per_topic_coherence],
+                'per_topic_coherence': per_topic_arr.tolist(),
                 'coherence_type': self.coherence_type,
                 'num_topics': len(topics),
                 'topn': topn
@@ -170,19 +284,132 @@ class CoherenceCalculator:
         if metrics is None:
             metrics = ['c_v', 'u_mass', 'c_npmi']
 
-        results = {}
+        if not topics:
+            return {
+                metric: {
+                    'coherence_score': 0.0,
+                    'per_topic_coherence': [],
+                    'coherence_type': metric,
+                    'num_topics': 0,
+                    'topn': topn
+                }
+                for metric in metrics
+            }
 
+        # Truncate topics to topn words (skip the re-slice when every topic
+        # already fits, avoiding a new list per topic)
+        if all(len(topic) <= topn for topic in topics):
+            topics_truncated = topics
+        else:
+            topics_truncated = [topic[:topn] for topic in topics]
+
+        # For large corpora, running one worker process per metric beats
+        # sharing the accumulator sequentially: each worker pays its own
+        # corpus scan, but the scans run concurrently. Below the threshold,
+        # fork/pickle overhead dominates and the shared-accumulator path wins.
+        if len(self.texts) >= self.MULTIPROCESS_THRESHOLD and len(metrics) > 1:
+            return self._calculate_metrics_parallel(topics, topics_truncated, topn, metrics)
+
+        # The expensive part of coherence calculation is accumulating word
+        # (co-)occurrence counts over self.texts. Metrics can share a
+        # single pass over the corpus only when their accumulators are
+        # identical, which means the same sliding-window size: c_v scans
+        # 110-token windows while c_npmi/c_uci scan 10-token windows, so
+        # they must not share counts. u_mass uses document-level counts
+        # and groups separately.
+        metric_groups: Dict[Optional[int], List[str]] = {}
         for metric in metrics:
-            logger.info(f"Calculating {metric} coherence...")
+            metric_groups.setdefault(self.WINDOW_SIZES.get(metric), []).append(metric)
 
-            # Create temporary calculator for this metric
-            calc = CoherenceCalculator(
-                texts=self.texts,
-                dictionary=self.dictionary,
-                coherence_type=metric
-            )
+        results = {}
 
-            results[metric] = calc.calculate_topic_coherence(topics, topn)
+        for metric_group in metric_groups.values():
+            shared_accumulator = None
+
+            for metric in metric_group:
+                logger.info(f"Calculating {metric} coherence...")
+
+                try:
+                    if metric == 'u_mass':
+                        cm = CoherenceModel(
+                            topics=topics_truncated,
+                            corpus=self.bow_corpus,
+                            dictionary=self.dictionary,
+                            coherence=metric,
+                            processes=self._coherence_processes()
+                        )
+                    else:
+                        cm = CoherenceModel(
+                            topics=topics_truncated,
+                            texts=self.texts,
+                            dictionary=self.dictionary,
+                            coherence=metric,
+                            processes=self._coherence_processes()
+                        )
+
+                    if shared_accumulator is None:
+                        # First metric in the group pays for the corpus scan
+                        cm.estimate_probabilities()
+                        shared_accumulator = cm._accumulator
+                    else:
+                        # Subsequent metrics reuse the cached counts
+                        cm._accumulator = shared_accumulator
+
+                    coherence_score = cm.get_coherence()
+                    per_topic_coherence = cm.get_coherence_per_topic()
+
+                    logger.info(f"Overall coherence ({metric}): {coherence_score:.4f}")
+
+                    results[metric] = {
+                        'coherence_score': float(coherence_score),
+                        'per_topic_coherence': np.asarray(per_topic_coherence, dtype=np.float64).tolist(),
+                        'coherence_type': metric,
+                        'num_topics': len(topics),
+                        'topn': topn
+                    }
+
+                except Exception as e:
+                    logger.error(f"Coherence calculation failed for {metric}: {e}")
+                    results[metric] = {
+                        'coherence_score': 0.0,
+                        'per_topic_coherence': [0.0] * len(topics),
+                        'coherence_type': metric,
+                        'num_topics': len(topics),
+                        'topn': topn,
+                        'error': str(e)
+                    }
+
+        return results
+
+    def _calculate_metrics_parallel(
+        self,
+        topics: List[List[str]],
+        topics_truncated: List[List[str]],
+        topn: int,
+        metrics: List[str]
+    ) -> Dict[str, Dict[str, Any]]:
+        """Run one worker process per metric (large corpora only)."""
+        logger.info(f"Calculating {len(metrics)} coherence metrics in parallel...")
+
+        results = {}
+        max_workers = min(len(metrics), os.cpu_count() or 1)
+
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                metric: executor.submit(
+                    _calc_one_metric,
+                    self.texts,
+                    self.dictionary,
+                    topics_truncated,
+                    len(topics),
+                    topn,
+                    metric
+                )
+                for metric in metrics
+            }
+
+            for metric, future in futures.items():
+                results[metric] = future.result()
 
         return results
 
@@ -261,6 +488,9 @@ def calculate_coherence_for_job(
     Returns:
         Dict with coherence statistics
     """
+    if dictionary is None:
+        dictionary = _cached_dictionary(tokenized_texts)
+
     calculator = CoherenceCalculator(
         texts=tokenized_texts,
         dictionary=dictionary,
@@ -288,6 +518,9 @@ def calculate_all_coherence_metrics(
     Returns:
         Dict mapping metric name to coherence results
     """
+    if dictionary is None:
+        dictionary = _cached_dictionary(tokenized_texts)
+
     calculator = CoherenceCalculator(
         texts=tokenized_texts,
         dictionary=dictionary,
@@ -31,6 +31,21 @@ except ImportError:
     SKLEARN_AVAILABLE = False
     logger.warning("scikit-learn not available. Install with: pip install scikit-learn")
 
+# Optional: openTSNE provides multithreaded FFT-accelerated t-SNE (FIt-SNE)
+try:
+    import openTSNE
+    OPENTSNE_AVAILABLE = True
+except ImportError:
+    OPENTSNE_AVAILABLE = False
+
+# Optional: RAPIDS cuML provides CUDA implementations of UMAP/TSNE/PCA
+try:
+    import cupy
+    import cuml
+    CUML_AVAILABLE = True
+except ImportError:
+    CUML_AVAILABLE = False
+
 
 class DimensionalityReducer:
     """
@@ -42,10 +57,14 @@ class DimensionalityReducer:
         - pca: Principal Component Analysis (fast, linear)
     """
 
+    # Minimum sample count before GPU transfer overhead pays off
+    GPU_MIN_SAMPLES = 5000
+
     def __init__(
         self,
         method: str = 'umap',
         random_state: int = 42,
+        backend: str = 'auto',
         **kwargs
     ):
         """
@@ -54,13 +73,21 @@ class DimensionalityReducer:
         Args:
             method: Reduction method ('umap', 'tsne', or 'pca')
             random_state: Random seed for reproducibility
+            backend: 'auto' (GPU via cuML if available and input is large),
+                     'cuda' (force GPU), or 'cpu'
             **kwargs: Additional parameters for the chosen method
         """
         self.method = method
         self.random_state = random_state
+        self.backend = backend
         self.kwargs = kwargs
         self.reducer = None
 
+        # Euclidean on L2-normalized rows is equivalent to cosine (up to a
+        # monotone transform) and stays on pynndescent's SIMD fast path.
+        # Only applied when the caller didn't ask for a specific metric.
+        self.normalize_input = (method == 'umap' and 'metric' not in kwargs)
+
         # Initialize reducer based on method
         if method == 'umap':
             if not UMAP_AVAILABLE:
@@ -70,30 +97,47 @@ class DimensionalityReducer:
             umap_params = {
                 'n_neighbors': kwargs.get('n_neighbors', 15),
                 'min_dist': kwargs.get('min_dist', 0.1),
-                'metric': kwargs.get('metric', 'cosine'),
+                'metric': kwargs.get('metric', 'euclidean'),
                 'n_components': 2,
-                'random_state': random_state
+                'random_state': random_state,
+                'low_memory': False,
+                'n_jobs': -1
             }
 
             self.reducer = umap.UMAP(**umap_params)
             logger.info(f"UMAP reducer initialized with params: {umap_params}")
 
         elif method == 'tsne':
-            if not SKLEARN_AVAILABLE:
+            if OPENTSNE_AVAILABLE:
+                # FFT-based gradients + PCA init converge in far fewer iterations
+                self.reducer = openTSNE.TSNE(
+                    n_components=2,
+                    perplexity=kwargs.get('perplexity', 30),
+                    n_iter=kwargs.get('n_iter', 500),
+                    initialization='pca',
+                    negative_gradient_method='fft',
+                    n_jobs=-1,
+                    random_state=random_state
+                )
+                logger.info("openTSNE reducer initialized (FFT gradients, PCA init)")
+            elif SKLEARN_AVAILABLE:
+                # Fallback: sklearn Barnes-Hut with PCA init (roughly halves
+                # the iterations needed to converge vs random init)
+                tsne_params = {
+                    'n_components': 2,
+                    'perplexity': kwargs.get('perplexity', 30),
+                    'learning_rate': kwargs.get('learning_rate', 'auto'),
+                    'n_iter': kwargs.get('n_iter', 500),
+                    'init': 'pca',
+                    'n_jobs': -1,
+                    'random_state': random_state
+                }
+
+                self.reducer = TSNE(**tsne_params)
+                logger.info(f"t-SNE reducer initialized with params: {tsne_params}")
+            else:
                 raise ImportError("scikit-learn not installed. Run: pip install scikit-learn")
 
-            # Default t-SNE parameters
-            tsne_params = {
-                'n_components': 2,
-                'perplexity': kwargs.get('perplexity', 30),
-                'learning_rate': kwargs.get('learning_rate', 200),
-                'n_iter': kwargs.get('n_iter', 1000),
-                'random_state': random_state
-            }
-
-            self.reducer = TSNE(**tsne_params)
-            logger.info(f"t-SNE reducer initialized with params: {tsne_params}")
-
         elif method == 'pca':
             if not SKLEARN_AVAILABLE:
                 raise ImportError("scikit-learn not installed. Run: pip install scikit-learn")
@@ -120,8 +164,24 @@ class DimensionalityReducer:
 
         logger.info(f"Reducing {embeddings.shape[0]} embeddings from {embeddings.shape[1]}D to 2D using {self.method}...")
 
+        if self.normalize_input:
+            norms = np.linalg.norm(embeddings, axis=1, keepdims=True).clip(1e-12)
+            embeddings = embeddings / norms
+
+        if self._use_gpu(embeddings.shape[0]):
+            try:
+                coords_2d = self._reduce_gpu(embeddings)
+                logger.info(f"GPU reduction completed. Output shape: {coords_2d.shape}")
+                return coords_2d
+            except Exception as e:
+                logger.error(f"GPU reduction failed, falling back to CPU: {e}")
+
         try:
-            coords_2d = self.reducer.fit_transform(embeddings)
+            if self.method == 'tsne' and OPENTSNE_AVAILABLE:
+                # openTSNE exposes fit() returning the embedding directly
+                coords_2d = np.asarray(self.reducer.fit(embeddings))
+            else:
+                coords_2d = self.reducer.fit_transform(embeddings)
             logger.info(f"Dimensionality reduction completed. Output shape: {coords_2d.shape}")
             return coords_2d
 
@@ -130,6 +190,36 @@ class DimensionalityReducer:
             # Return zeros as fallback
             return np.zeros((embeddings.shape[0], 2))
 
+    def _use_gpu(self, n_samples: int) -> bool:
+        """Whether to run this reduction on GPU via cuML."""
+        if not CUML_AVAILABLE or self.backend == 'cpu':
+            return False
+        # For small inputs the host-device transfer dominates any speedup
+        return self.backend == 'cuda' or n_samples >= self.GPU_MIN_SAMPLES
+
+    def _reduce_gpu(self, embeddings: np.ndarray) -> np.ndarray:
+        """Run the reduction on GPU with cuML and return a NumPy array."""
+        logger.info(f"Reducing {embeddings.shape[0]} embeddings on GPU via cuML ({self.method})...")
+
+        if self.method == 'umap':
+            reducer = cuml.manifold.UMAP(
+                n_neighbors=self.kwargs.get('n_neighbors', 15),
+                min_dist=self.kwargs.get('min_dist', 0.1),
+                n_components=2,
+                random_state=self.random_state
+            )
+        elif self.method == 'tsne':
+            reducer = cuml.manifold.TSNE(
+                n_components=2,
+                perplexity=self.kwargs.get('perplexity', 30),
+                random_state=self.random_state
+            )
+        else:
+            reducer = cuml.PCA(n_components=2, random_state=self.random_state)
+
+        coords = reducer.fit_transform(cupy.asarray(embeddings, dtype='float32'))
+        return cupy.asnumpy(coords)
+
     def calculate_distances(self, coords_2d: np.ndarray) -> np.ndarray:
         """
         Calculate pairwise Euclidean distances in 2D space.
@@ -140,10 +230,13 @@ class DimensionalityReducer:
         Returns:
             Distance matrix of shape (n_points, n_points)
         """
-        from scipy.spatial.distance import pdist, squareform
-
-        distances = pdist(coords_2d, metric='euclidean')
-        distance_matrix = squareform(distances)
+        # Single BLAS gemm instead of scipy pdist + squareform:
+        # ||a - b||^2 = ||a||^2 + ||b||^2 - 2 a.b
+        coords = np.asarray(coords_2d, dtype=np.float32)
+        sq_norms = (coords ** 2).sum(axis=1)
+        distance_matrix = np.sqrt(
+            np.maximum(sq_norms[:, None] + sq_norms[None, :] - 2 * coords @ coords.T, 0.0)
+        )
 
         return distance_matrix
 
@@ -192,15 +285,21 @@ class TopicDistanceCalculator:
 
         logger.info(f"Calculating inter-topic distances for {n_topics} topics using {self.method}...")
 
+        # Normalize rows once up front (unit-norm float32 halves memory
+        # traffic through the reducer's inner loops and makes euclidean
+        # equivalent to cosine)
+        norms = np.linalg.norm(topic_term_matrix, axis=1, keepdims=True)
+        normalized_matrix = (topic_term_matrix / np.clip(norms, 1e-12, None)).astype(np.float32, copy=False)
+
         # Reduce to 2D
         reducer = DimensionalityReducer(method=self.method, random_state=self.random_state)
-        coords_2d = reducer.reduce(topic_term_matrix)
+        coords_2d = reducer.reduce(normalized_matrix)
 
         # Calculate distances
         distances = reducer.calculate_distances(coords_2d)
 
-        # Format coordinates as list of [x, y]
-        coordinates = [[float(x), float(y)] for x, y in coords_2d]
+        # Format coordinates as list of [x, y] (single C-level conversion)
+        coordinates = np.asarray(coords_2d, dtype=np.float64).tolist()
 
         logger.info(f"Topic distance calculation completed")
 
@@ -235,8 +334,11 @@ class TopicDistanceCalculator:
         # Sample if needed
         if sample_size and n_docs > sample_size:
             logger.info(f"Sampling {sample_size} documents from {n_docs} for visualization")
-            indices = np.random.choice(n_docs, sample_size, replace=False)
-            document_topics_sampled = document_topics[indices]
+            # shuffle=False uses an O(sample_size) selection instead of
+            # permuting the full index range
+            rng = np.random.default_rng(self.random_state)
+            indices = rng.choice(n_docs, size=sample_size, replace=False, shuffle=False)
+            document_topics_sampled = np.take(document_topics, indices, axis=0)
         else:
             document_topics_sampled = document_topics
             indices = np.arange(n_docs)
@@ -247,11 +349,11 @@ class TopicDistanceCalculator:
         reducer = DimensionalityReducer(method=self.method, random_state=self.random_state)
         coords_2d = reducer.reduce(document_topics_sampled)
 
-        # Get dominant topic for each document
-        dominant_topics = [int(np.argmax(doc_topic)) for doc_topic in document_topics_sampled]
+        # Get dominant topic for each document (single argmax pass)
+        dominant_topics = np.argmax(document_topics_sampled, axis=1).astype(np.int32).tolist()
 
-        # Format coordinates
-        coordinates = [[float(x), float(y)] for x, y in coords_2d]
+        # Format coordinates (single C-level conversion)
+        coordinates = np.asarray(coords_2d, dtype=np.float64).tolist()
 
         logger.info("Document clustering completed")
 
@@ -10,11 +10,27 @@ Usage:
 """
 
 import logging
+import re
 from typing import List, Dict, Any, Tuple
 import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# Tokenizer for the fast lexicon-based sentiment path
+WORD_RE = re.compile(r"[A-Za-z']+")
+
+# Minimal modifier set (negations, common intensifiers) used only when
+# the pattern lexicon cannot be loaded; normally _load_polarity_lexicon
+# derives the full set from the lexicon itself. WORD_RE keeps
+# contractions whole, so negative contractions ("don't", "can't", ...)
+# are caught by the n't suffix check in _fast_polarity rather than
+# listed here.
+_BASE_MODIFIER_TOKENS = frozenset({
+    'not', 'cannot', 'no', 'never', 'neither', 'nor', 'without',
+    'very', 'really', 'too', 'so', 'extremely', 'quite',
+    'barely', 'hardly', 'rather', 'pretty', 'most', 'least'
+})
+
 # Try to import sentiment analysis libraries
 try:
     from textblob import TextBlob
@@ -24,7 +40,8 @@ except ImportError:
     logger.warning("TextBlob not available. Install with: pip install textblob")
 
 try:
-    from transformers import pipeline
+    import torch
+    from transformers import AutoTokenizer, AutoModelForSequenceClassification
     TRANSFORMERS_AVAILABLE = True
 except ImportError:
     TRANSFORMERS_AVAILABLE = False
@@ -53,6 +70,9 @@ class SentimentAnalyzer:
         if method == 'textblob':
             if not TEXTBLOB_AVAILABLE:
                 raise ImportError("TextBlob not installed. Run: pip install textblob")
+            # Load the pattern polarity lexicon once so batch scoring can do
+            # plain dict lookups instead of building a TextBlob per comment
+            self.word_polarity, self.modifier_tokens = self._load_polarity_lexicon()
             logger.info("Using TextBlob for sentiment analysis")
 
         elif method == 'transformers':
@@ -61,18 +81,119 @@ class SentimentAnalyzer:
 
             logger.info("Loading sentiment analysis model (distilbert)...")
             try:
-                self.model = pipeline(
-                    "sentiment-analysis",
-                    model="distilbert-base-uncased-finetuned-sst-2-english",
-                    device=-1  # CPU
-                )
-                logger.info("Model loaded successfully")
+                model_name = "distilbert-base-uncased-finetuned-sst-2-english"
+                self.device = 'cuda' if torch.cuda.is_available() else 'cpu'
+                # fp16 halves memory bandwidth and ALU use on GPU; CPU stays fp32
+                dtype = torch.float16 if self.device == 'cuda' else torch.float32
+
+                self.tokenizer = AutoTokenizer.from_pretrained(model_name)
+                self.model = AutoModelForSequenceClassification.from_pretrained(
+                    model_name, torch_dtype=dtype
+                ).to(self.device).eval()
+
+                # torch.compile (PyTorch >= 2.x) speeds up the steady-state
+                # forward pass; harmless to skip if compilation fails
+                if hasattr(torch, 'compile'):
+                    try:
+                        self.model = torch.compile(self.model, mode='reduce-overhead')
+                    except Exception as compile_error:
+                        logger.warning(f"torch.compile unavailable: {compile_error}")
+
+                # One-time warmup so the first real batch doesn't pay
+                # kernel-launch / compilation costs
+                try:
+                    self._transformers_scores(['warmup'])
+                except Exception as warmup_error:
+                    logger.warning(f"Model warmup failed: {warmup_error}")
+
+                logger.info(f"Model loaded successfully on {self.device}")
             except Exception as e:
                 logger.error(f"Failed to load transformers model: {e}")
                 raise
         else:
             raise ValueError(f"Unknown method: {method}. Choose 'textblob' or 'transformers'")
 
+    @staticmethod
+    def _load_polarity_lexicon() -> Tuple[Dict[str, float], frozenset]:
+        """
+        Load TextBlob's pattern sentiment lexicon into a flat word -> polarity
+        dict, plus the set of modifier tokens that invalidate the fast path.
+
+        pattern treats every adverb ('RB') sense as a potential intensity
+        modifier of the following word, and its negations flip polarity, so
+        texts containing any of them must go through the full parser.
+
+        Returns an empty dict if the lexicon cannot be loaded, in which case
+        the analyzer falls back to per-text TextBlob parsing.
+        """
+        lexicon = {}
+        modifiers = set(_BASE_MODIFIER_TOKENS)
+        try:
+            from textblob.en import sentiment as pattern_sentiment
+            pattern_sentiment.load()
+
+            for word, senses in pattern_sentiment.items():
+                # Each entry maps POS tag -> (polarity, subjectivity, ...);
+                # the None key holds the POS-averaged scores
+                scores = senses.get(None) or next(iter(senses.values()), None)
+                if scores:
+                    lexicon[word] = float(scores[0])
+                if 'RB' in senses:
+                    modifiers.add(word)
+
+            modifiers.update(getattr(pattern_sentiment, 'negations', ()))
+        except Exception as e:
+            logger.warning(f"Could not load polarity lexicon, falling back to TextBlob: {e}")
+
+        return lexicon, frozenset(modifiers)
+
+    def _fast_polarity(self, text: str) -> float:
+        """
+        Score a text with direct lexicon lookups, avoiding TextBlob allocation.
+
+        Falls back to the full TextBlob parser for texts containing negations
+        or intensifiers, which need pattern's modifier handling.
+        """
+        tokens = WORD_RE.findall(text.lower())
+        if not tokens:
+            return 0.0
+
+        if not self.modifier_tokens.isdisjoint(tokens) \
+                or any(t.endswith("n't") for t in tokens):
+            return self.analyze_text(text)
+
+        polarities = np.fromiter(
+            (self.word_polarity[t] for t in tokens if t in self.word_polarity),
+            dtype=np.float64
+        )
+        if polarities.size == 0:
+            return 0.0
+
+        return float(polarities.mean())
+
+    def _transformers_scores(self, texts: List[str]) -> List[float]:
+        """
+        Run a single batched forward pass and return scores in [-1, 1].
+
+        Tokenizes the whole batch at once with dynamic padding to the batch
+        max length, and disables autograd bookkeeping with inference_mode.
+        """
+        encoded = self.tokenizer(
+            texts,
+            padding=True,
+            truncation=True,
+            max_length=256,
+            return_tensors='pt'
+        ).to(self.device)
+
+        with torch.inference_mode():
+            logits = self.model(**encoded).logits
+
+        probs = logits.softmax(-1)
+        # SST-2 head: index 0 = NEGATIVE, index 1 = POSITIVE
+        scores = probs[:, 1] - probs[:, 0]
+        return scores.float().cpu().numpy().tolist()
+
     def analyze_text(self, text: str) -> float:
         """
         Analyze sentiment of a single text.
@@ -93,16 +214,7 @@ class SentimentAnalyzer:
                 return blob.sentiment.polarity
 
             elif self.method == 'transformers':
-                # Transformers returns label (POSITIVE/NEGATIVE) and score (0-1)
-                result = self.model(text[:512])[0]  # Truncate to max length
-                label = result['label']
-                score = result['score']
-
-                # Convert to -1 to 1 scale
-                if label == 'POSITIVE':
-                    return score
-                else:  # NEGATIVE
-                    return -score
+                return self._transformers_scores([text[:512]])[0]
 
         except Exception as e:
             logger.warning(f"Sentiment analysis failed for text: {e}")
@@ -119,8 +231,41 @@ class SentimentAnalyzer:
         Returns:
             List of sentiment scores (-1 to 1)
         """
+        if not texts:
+            return []
+
+        scores = [0.0] * len(texts)
+
+        # Empty/whitespace comments score 0.0 by definition; drop them before
+        # deduplication so neither path pays for them
+        nonempty_idx = [i for i, t in enumerate(texts) if t and t.strip()]
+        if not nonempty_idx:
+            return scores
+
+        nonempty = [texts[i] for i in nonempty_idx]
+
+        # Comment corpora contain many duplicate strings ("great video",
+        # emojis, spam); score each unique text once and broadcast back
+        unique, inverse = np.unique(np.asarray(nonempty, dtype=object), return_inverse=True)
+        if len(unique) < len(nonempty):
+            logger.info(f"Scoring {len(unique)} unique texts out of {len(nonempty)}")
+            unique_scores = np.asarray(self._score_batch(unique.tolist(), batch_size), dtype=np.float64)
+            nonempty_scores = unique_scores[inverse].tolist()
+        else:
+            nonempty_scores = self._score_batch(nonempty, batch_size)
+
+        # Scatter scores back to the original positions
+        for i, score in zip(nonempty_idx, nonempty_scores):
+            scores[i] = score
+
+        return scores
+
+    def _score_batch(self, texts: List[str], batch_size: int) -> List[float]:
+        """Score texts without deduplication (internal scoring path)."""
         if self.method == 'textblob':
-            # TextBlob is fast enough to process individually
+            if self.word_polarity:
+                # Fast path: lexicon lookups, TextBlob only for modifier-bearing texts
+                return [self._fast_polarity(text) for text in texts]
             return [self.analyze_text(text) for text in texts]
 
         elif self.method == 'transformers':
@@ -128,24 +273,20 @@ class SentimentAnalyzer:
             sentiments = []
 
             for i in range(0, len(texts), batch_size):
-                batch = texts[i:i + batch_size]
-                batch_truncated = [text[:512] for text in batch]  # Truncate
+                batch = [text[:512] for text in texts[i:i + batch_size]]  # Truncate
 
                 try:
-                    results = self.model(batch_truncated)
-
-                    for result in results:
-                        label = result['label']
-                        score = result['score']
-
-                        if label == 'POSITIVE':
-                            sentiments.append(score)
-                        else:
-                            sentiments.append(-score)
-
+                    sentiments.extend(self._transformers_scores(batch))
                 except Exception as e:
-                    logger.warning(f"Batch sentiment analysis failed: {e}")
-                    sentiments.extend([0.0] * len(batch))
+                    # Isolate the failure: retry per text so one pathological
+                    # input doesn't zero out the whole batch
+                    logger.warning(f"Batch sentiment analysis failed, retrying per text: {e}")
+                    for text in batch:
+                        try:
+                            sentiments.append(self._transformers_scores([text])[0])
+                        except Exception as text_error:
+                            logger.warning(f"Sentiment analysis failed for text: {text_error}")
+                            sentiments.append(0.0)
 
             return sentiments
 
@@ -183,20 +324,29 @@ class SentimentAnalyzer:
         logger.info("Computing sentiment scores...")
         sentiments = self.analyze_batch(comments)
 
-        # For each topic, collect sentiments of documents assigned to it
-        topic_sentiments = []
+        # Vectorized per-topic aggregation: one boolean mask over the (N, K)
+        # doc-topic matrix replaces the N x K Python loop
+        s = np.asarray(sentiments, dtype=np.float32)
+        mask = np.asarray(document_topics)[:, :num_topics] > 0.1  # (N, K)
 
-        for topic_num in range(num_topics):
-            # Get documents where this topic is dominant (probability > 0.1)
-            topic_docs = []
-            topic_sent = []
+        counts = mask.sum(axis=0)
+        sum_s = mask.T @ s
+        sum_s2 = mask.T @ (s * s)
+
+        # Per-topic mean/std (guard against empty topics)
+        safe_counts = np.maximum(counts, 1)
+        avg = sum_s / safe_counts
+        variance = np.maximum(sum_s2 / safe_counts - avg ** 2, 0.0)
+        std = np.sqrt(variance)
 
-            for doc_idx in range(len(comments)):
-                if document_topics[doc_idx][topic_num] > 0.1:
-                    topic_docs.append(doc_idx)
-                    topic_sent.append(sentiments[doc_idx])
+        # Per-topic positive/negative counts via the same mask
+        positive = mask.T @ (s > 0.1).astype(np.int32)
+        negative = mask.T @ (s < -0.1).astype(np.int32)
+        neutral = counts - positive - negative
 
-            if not topic_sent:
+        topic_sentiments = []
+        for topic_num in range(num_topics):
+            if counts[topic_num] == 0:
                 # No documents assigned to this topic
                 topic_sentiments.append({
                     'topic_number': topic_num,
@@ -208,31 +358,28 @@ class SentimentAnalyzer:
                 })
                 continue
 
-            # Calculate statistics
-            topic_sent_array = np.array(topic_sent)
-            avg_sentiment = float(np.mean(topic_sent_array))
-            sentiment_std = float(np.std(topic_sent_array))
-
-            # Classify into positive/neutral/negative
-            positive_count = int(np.sum(topic_sent_array > 0.1))
-            negative_count = int(np.sum(topic_sent_array < -0.1))
-            neutral_count = len(topic_sent) - positive_count - negative_count
-
             topic_sentiments.append({
                 'topic_number': topic_num,
-                'avg_sentiment': avg_sentiment,
-                'sentiment_std': sentiment_std,
-                'positive_count': positive_count,
-                'neutral_count': neutral_count,
-                'negative_count': negative_count
+                'avg_sentiment': float(avg[topic_num]),
+                'sentiment_std': float(std[topic_num]),
+                'positive_count': int(positive[topic_num]),
+                'neutral_count': int(neutral[topic_num]),
+                'negative_count': int(negative[topic_num])
             })
 
-            logger.info(
-                f"Topic {topic_num}: avg={avg_sentiment:.3f}, "
-                f"pos={positive_count}, neu={neutral_count}, neg={negative_count}"
-            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    f"Topic {topic_num}: avg={avg[topic_num]:.3f}, "
+                    f"pos={int(positive[topic_num])}, neu={int(neutral[topic_num])}, neg={int(negative[topic_num])}"
+                )
 
-        logger.info("Sentiment analysis completed")
+        # Single summary line instead of one INFO record per topic
+        assigned = counts > 0
+        mean_sentiment = float(avg[assigned].mean()) if assigned.any() else 0.0
+        logger.info(
+            f"Sentiment analysis completed: topics={num_topics}, mean={mean_sentiment:.3f}, "
+            f"pos={int(positive.sum())}, neu={int(neutral.sum())}, neg={int(negative.sum())}"
+        )
         return topic_sentiments
 
     @staticmethod
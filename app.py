@@ -1,17 +1,40 @@
 import argparse
+import itertools
 import json
 import os
+import random
+import re
+import sys
 import threading
+import time
 import uuid
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import asdict, dataclass
 from datetime import datetime
 from queue import Queue
 
+import numpy as np
 import yt_dlp
-from flask import Flask, jsonify, render_template, request, send_file
+from flask import (
+    Flask,
+    Response,
+    jsonify,
+    render_template,
+    request,
+    send_file,
+    stream_with_context,
+)
 from flask_cors import CORS
 from dotenv import load_dotenv
 
+# orjson is a C-implemented serializer, ~5-10x faster than stdlib json on
+# large comment arrays; fall back to stdlib when not installed
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from modeling.lda_model import LDAModel
 from modeling.nmf_model import NMFModel
 
@@ -37,6 +60,59 @@ MAX_WORKERS = (os.cpu_count() or 4) * 2  # Allow up to 2x CPU count
 # Cookies file for YouTube authentication (to avoid bot detection)
 COOKIES_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "cookies.txt")
 
+# yt-dlp on-disk cache (lazy-extractor state, sig cache) survives restarts
+YTDL_CACHE_DIR = os.path.join("data", ".ytdl_cache")
+
+# Minimum spacing between yt-dlp requests at 1 worker; do_extraction divides
+# it by the selected worker count, so the workers knob also sets request rate
+BASE_REQUEST_INTERVAL = 1.0
+
+# Exponential backoff for rate-limited requests
+RETRY_ATTEMPTS = 3
+RETRY_BASE_WAIT = 5.0
+RETRY_MAX_WAIT = 60.0
+RETRY_JITTER = 2.0
+
+RATE_LIMIT_MARKERS = ("429", "403", "Sign in to confirm")
+
+
+class RateLimiter:
+    """Token-bucket style pacing for outbound yt-dlp requests.
+
+    Shared by all extraction workers: acquire() blocks until at least
+    min_interval seconds have passed since the previous request, keeping the
+    overall request rate below YouTube's tolerance instead of detecting 403s
+    after the fact.
+    """
+
+    def __init__(self, min_interval=BASE_REQUEST_INTERVAL):
+        self.min_interval = min_interval
+        self.last_call = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until the next request slot is available."""
+        with self._lock:
+            now = time.monotonic()
+            delay = self.last_call + self.min_interval - now
+            if delay > 0:
+                time.sleep(delay)
+                now = time.monotonic()
+            self.last_call = now
+
+
+rate_limiter = RateLimiter()
+
+# Single-flight gate for backoff sleeps: when a request gets rate limited,
+# concurrent workers queue up here instead of all retrying at once
+retry_gate = threading.Semaphore(1)
+
+
+def _is_rate_limit_error(error):
+    """Check whether an extraction error looks like YouTube rate limiting."""
+    message = str(error)
+    return any(marker in message for marker in RATE_LIMIT_MARKERS)
+
 app = Flask(__name__)
 CORS(app)  # Enable CORS for React frontend
 app.config["OUTPUT_DIR"] = "data"
@@ -75,11 +151,35 @@ extraction_state = {
 }
 extraction_lock = threading.Lock()
 
+# Signals SSE subscribers whenever extraction_state changes; shares
+# extraction_lock so notifications happen under the same critical section
+extraction_condition = threading.Condition(extraction_lock)
+
+# Event mirror of extraction_state["stop_requested"]: workers can check it
+# without taking extraction_lock, and backoff sleeps can wait on it so a stop
+# request interrupts them immediately instead of after up to RETRY_MAX_WAIT
+extraction_stop_event = threading.Event()
+
 # Queue for multi-channel extraction
 extraction_queue = Queue()
-queue_list = []  # For display purposes
+queue_list = []  # For display purposes (keeps insertion order)
+queue_index = {}  # job_id -> queue_list entry, for O(1) status updates
 queue_lock = threading.Lock()
 
+# Monotonic change cursor: entries are stamped on insert and on every status
+# change, so status responses can send only what changed since a client's
+# last seen cursor instead of copying the whole queue per poll
+queue_seq = itertools.count(1)
+queue_max_seq = 0  # last cursor handed out (read/written under queue_lock)
+
+
+def _stamp_queue_entry(item):
+    """Mark a queue entry as changed. Caller must hold queue_lock."""
+    global queue_max_seq
+    queue_max_seq = next(queue_seq)
+    item["seq"] = queue_max_seq
+
+
 # Global state for topic modeling
 modeling_state = {
     "active": False,
@@ -92,12 +192,113 @@ modeling_state = {
     "channels": [],
 }
 modeling_lock = threading.Lock()
+modeling_condition = threading.Condition(modeling_lock)
+
+
+def _update_modeling_state(**kwargs):
+    """Publish a new modeling state snapshot (copy-on-write).
+
+    Snapshots are never mutated after publication, so readers can take the
+    modeling_state reference without locking (reference assignment is atomic
+    under the GIL); only writers serialize on modeling_lock. Long-polling
+    status readers are woken through modeling_condition.
+    """
+    global modeling_state
+    with modeling_condition:
+        new_state = modeling_state.copy()
+        new_state.update(kwargs)
+        modeling_state = new_state
+        modeling_condition.notify_all()
+
 
 # Queue for topic modeling jobs
 modeling_queue = Queue()
 modeling_jobs = {}  # job_id -> job metadata and results
 modeling_jobs_lock = threading.Lock()
 
+# Bounded pools shared across background jobs: one slot per queue type for the
+# job runners, and a single reusable pool for per-video scraping so
+# do_extraction does not spin up (and tear down) 2x CPU threads per job
+job_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="job")
+video_executor = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="video")
+
+
+def _dump_json(filepath, data):
+    """Write data as JSON (orjson + 1 MiB write buffer when available)."""
+    if ORJSON_AVAILABLE:
+        with open(filepath, "wb", buffering=1 << 20) as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(filepath, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+
+
+def _load_json(filepath):
+    """Parse a JSON file (orjson when available)."""
+    if ORJSON_AVAILABLE:
+        with open(filepath, "rb") as f:
+            return orjson.loads(f.read())
+    with open(filepath, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+# In-memory metadata caches, invalidated by mtime so warm listings are served
+# from RAM instead of re-reading and re-parsing every JSON file per request
+_meta_cache = {}  # path -> (st_mtime_ns, parsed JSON)
+_dir_stats_cache = {}  # videos_dir -> (dir st_mtime_ns, total_size, file_count)
+_meta_cache_lock = threading.RLock()
+
+
+def _cached_json(path):
+    """Load a JSON file through the mtime-validated in-memory cache."""
+    mtime_ns = os.stat(path).st_mtime_ns
+
+    with _meta_cache_lock:
+        cached = _meta_cache.get(path)
+        if cached and cached[0] == mtime_ns:
+            return cached[1]
+
+    data = _load_json(path)
+
+    with _meta_cache_lock:
+        _meta_cache[path] = (mtime_ns, data)
+
+    return data
+
+
+def _invalidate_cached_json(path):
+    """Drop a path from the metadata cache (call after writing the file)."""
+    with _meta_cache_lock:
+        _meta_cache.pop(path, None)
+
+
+def _videos_dir_stats(videos_dir):
+    """Return (total_size, file_count) for a videos dir, cached on dir mtime."""
+    try:
+        dir_mtime_ns = os.stat(videos_dir).st_mtime_ns
+    except OSError:
+        return 0, 0
+
+    with _meta_cache_lock:
+        cached = _dir_stats_cache.get(videos_dir)
+        if cached and cached[0] == dir_mtime_ns:
+            return cached[1], cached[2]
+
+    total_size = 0
+    file_count = 0
+    # scandir entries carry cached stat results: one syscall per entry
+    # instead of separate isfile + getsize lookups
+    with os.scandir(videos_dir) as it:
+        for entry in it:
+            if entry.is_file(follow_symlinks=False):
+                total_size += entry.stat().st_size
+                file_count += 1
+
+    with _meta_cache_lock:
+        _dir_stats_cache[videos_dir] = (dir_mtime_ns, total_size, file_count)
+
+    return total_size, file_count
+
 
 def get_already_downloaded_video_ids(channel_folder=None):
     """Get all video IDs that have already been downloaded.
@@ -108,55 +309,113 @@ def get_already_downloaded_video_ids(channel_folder=None):
     downloaded_ids = set()
     output_dir = app.config["OUTPUT_DIR"]
 
+    def collect_ids(videos_dir):
+        try:
+            with os.scandir(videos_dir) as it:
+                for entry in it:
+                    if entry.name.endswith(".json"):
+                        downloaded_ids.add(entry.name[:-5])
+        except OSError:
+            pass
+
     if channel_folder:
         # Check specific channel's videos folder
-        videos_dir = os.path.join(output_dir, channel_folder, "videos")
-        if os.path.exists(videos_dir):
-            for filename in os.listdir(videos_dir):
-                if filename.endswith(".json"):
-                    video_id = filename.replace(".json", "")
-                    downloaded_ids.add(video_id)
+        collect_ids(os.path.join(output_dir, channel_folder, "videos"))
     else:
         # Check all channels
         if os.path.exists(output_dir):
-            for channel_name in os.listdir(output_dir):
-                videos_dir = os.path.join(output_dir, channel_name, "videos")
-                if os.path.isdir(videos_dir):
-                    for filename in os.listdir(videos_dir):
-                        if filename.endswith(".json"):
-                            video_id = filename.replace(".json", "")
-                            downloaded_ids.add(video_id)
+            with os.scandir(output_dir) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        collect_ids(os.path.join(entry.path, "videos"))
 
     return downloaded_ids
 
 
-def get_channel_videos(channel_url):
+# Short-lived cache for channel listings: the "preview channel -> queue
+# extraction" workflow lists the same channel twice back to back, and a cold
+# yt-dlp channel-page fetch takes several seconds
+CHANNEL_CACHE_TTL = 300  # seconds
+_channel_cache = {}  # normalized channel URL -> (fetch time, (videos, channel_info))
+_channel_cache_lock = threading.Lock()
+
+# Negative cache: a mistyped channel or a throttled fetch fails after several
+# seconds of yt-dlp work, so remember failures briefly instead of retrying
+# end-to-end on every request
+NEGATIVE_TTL_NOT_FOUND = 30  # seconds
+NEGATIVE_TTL_RATE_LIMITED = 120  # seconds
+_channel_negative_cache = {}  # normalized channel URL -> (expiry, error message)
+
+
+class ChannelLookupError(Exception):
+    """A channel lookup failed recently; served from the negative cache."""
+
+
+def _normalize_channel_url(channel_input):
+    """Build the canonical /videos URL for a handle, channel id, or URL.
+
+    Both /api/channel-info and do_extraction key the listing cache on this
+    value, so the preview-then-extract workflow shares one yt-dlp fetch.
+    """
+    if not channel_input.startswith("http"):
+        if channel_input.startswith("@"):
+            return f"https://www.youtube.com/{channel_input}/videos"
+        return f"https://www.youtube.com/channel/{channel_input}/videos"
+    if "/videos" not in channel_input:
+        return channel_input.rstrip("/") + "/videos"
+    return channel_input
+
+
+def get_channel_videos(channel_url, force_refresh=False):
     """Récupère la liste de toutes les vidéos d'une chaîne avec métadonnées."""
     ydl_opts = {
         "quiet": True,
         "no_warnings": True,
         "extract_flat": True,
         "force_generic_extractor": False,
+        "lazy_playlist": True,
+        "cachedir": YTDL_CACHE_DIR,
     }
     # Add cookies if file exists
     if os.path.exists(COOKIES_FILE):
         ydl_opts["cookiefile"] = COOKIES_FILE
 
-    # Construire l'URL de la chaîne si ce n'est pas déjà une URL complète
     original_input = channel_url
-    if not channel_url.startswith("http"):
-        if channel_url.startswith("@"):
-            channel_url = f"https://www.youtube.com/{channel_url}/videos"
+    channel_url = _normalize_channel_url(channel_url)
+
+    with _channel_cache_lock:
+        if force_refresh:
+            _channel_cache.pop(channel_url, None)
+            _channel_negative_cache.pop(channel_url, None)
         else:
-            channel_url = f"https://www.youtube.com/channel/{channel_url}/videos"
-    elif "/videos" not in channel_url:
-        channel_url = channel_url.rstrip("/") + "/videos"
+            # Serve a recent listing from cache if one exists
+            cached = _channel_cache.get(channel_url)
+            if cached is not None and time.monotonic() - cached[0] < CHANNEL_CACHE_TTL:
+                return cached[1]
+
+            # Fail fast on lookups that just failed
+            negative = _channel_negative_cache.get(channel_url)
+            if negative is not None and time.monotonic() < negative[0]:
+                raise ChannelLookupError(negative[1])
 
     videos = []
     channel_info = {}
 
     with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-        result = ydl.extract_info(channel_url, download=False)
+        try:
+            result = ydl.extract_info(channel_url, download=False)
+        except Exception as e:
+            ttl = (
+                NEGATIVE_TTL_RATE_LIMITED
+                if _is_rate_limit_error(e)
+                else NEGATIVE_TTL_NOT_FOUND
+            )
+            with _channel_cache_lock:
+                _channel_negative_cache[channel_url] = (
+                    time.monotonic() + ttl,
+                    str(e),
+                )
+            raise
 
         if result:
             # Extract channel metadata
@@ -184,11 +443,22 @@ def get_channel_videos(channel_url):
                             }
                         )
 
+    with _channel_cache_lock:
+        _channel_cache[channel_url] = (time.monotonic(), (videos, channel_info))
+
     return videos, channel_info
 
 
-def get_video_comments(video_url):
-    """Fetch all comments from a video."""
+# Per-thread YoutubeDL instances for comment extraction. YoutubeDL is not
+# thread-safe, but the video pool threads persist across jobs, so reusing one
+# instance per thread keeps the HTTP session (urllib3 keep-alive) and
+# extractor state alive instead of paying TLS handshake + cookie parsing +
+# extractor init for every video
+_thread_local = threading.local()
+
+
+def _comments_ydl_opts():
+    """Build the yt-dlp options used for comment extraction."""
     ydl_opts = {
         "quiet": True,
         "no_warnings": True,
@@ -196,32 +466,70 @@ def get_video_comments(video_url):
         "getcomments": True,
         "extract_flat": False,
         "extractor_args": {
-            "youtube": {"comment_sort": ["top"], "skip": ["dash", "hls"]}
+            "youtube": {
+                "comment_sort": ["top"],
+                "skip": ["dash", "hls"],
+                # Single client avoids the double player negotiation
+                "player_client": ["web"],
+            }
         },
         "ignore_no_formats_error": True,
         "check_formats": False,  # Don't check format availability
+        "cachedir": YTDL_CACHE_DIR,
     }
     # Add cookies if file exists
     if os.path.exists(COOKIES_FILE):
         ydl_opts["cookiefile"] = COOKIES_FILE
+    return ydl_opts
+
+
+def _get_comments_ydl():
+    """Return this thread's reusable YoutubeDL instance, creating it lazily."""
+    ydl = getattr(_thread_local, "comments_ydl", None)
+    if ydl is None:
+        ydl = yt_dlp.YoutubeDL(_comments_ydl_opts())
+        _thread_local.comments_ydl = ydl
+    return ydl
+
+
+def get_video_comments(video_url):
+    """Fetch all comments from a video."""
+    ydl = _get_comments_ydl()
 
     comments = []
-    with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-        result = ydl.extract_info(video_url, download=False)
-
-        if result and "comments" in result:
-            for comment in result["comments"]:
-                comments.append(
-                    {
-                        "author": comment.get("author"),
-                        "author_id": comment.get("author_id"),
-                        "text": comment.get("text"),
-                        "likes": comment.get("like_count", 0),
-                        "timestamp": comment.get("timestamp"),
-                        "parent": comment.get("parent", "root"),
-                        "is_reply": comment.get("parent") != "root",
-                    }
-                )
+    result = None
+    for attempt in range(RETRY_ATTEMPTS):
+        rate_limiter.acquire()
+        try:
+            result = ydl.extract_info(video_url, download=False)
+            break
+        except Exception as e:
+            if attempt == RETRY_ATTEMPTS - 1 or not _is_rate_limit_error(e):
+                raise
+            wait_time = min(
+                RETRY_MAX_WAIT,
+                RETRY_BASE_WAIT * 2**attempt + random.uniform(0, RETRY_JITTER),
+            )
+            print(f"Rate limited, retrying in {wait_time:.1f}s: {e}")
+            # Single-flight the backoff so concurrent workers don't all
+            # hammer the API again at the same moment; waiting on the stop
+            # event lets a stop request interrupt the sleep
+            with retry_gate:
+                extraction_stop_event.wait(wait_time)
+
+    if result and "comments" in result:
+        for comment in result["comments"]:
+            comments.append(
+                {
+                    "author": comment.get("author"),
+                    "author_id": comment.get("author_id"),
+                    "text": comment.get("text"),
+                    "likes": comment.get("like_count", 0),
+                    "timestamp": comment.get("timestamp"),
+                    "parent": comment.get("parent", "root"),
+                    "is_reply": comment.get("parent") != "root",
+                }
+            )
 
     return comments
 
@@ -276,7 +584,9 @@ def get_channel_info():
         return jsonify({"error": "Veuillez fournir un nom ou ID de chaîne"}), 400
 
     try:
-        videos, channel_info = get_channel_videos(channel_input)
+        videos, channel_info = get_channel_videos(
+            channel_input, force_refresh=bool(data.get("force_refresh"))
+        )
         return jsonify(
             {
                 "channel_name": channel_info.get("channel_name", "Unknown"),
@@ -287,31 +597,37 @@ def get_channel_info():
                 "videos": videos,
             }
         )
+    except ChannelLookupError as e:
+        # Recent failure served from the negative cache; pass force_refresh
+        # to bypass it
+        return jsonify({"error": str(e), "cached": True}), 429
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
 
 def save_progress(filepath, data, lock):
-    """Save current progress to JSON file (thread-safe)."""
+    """Save current progress to JSON file (thread-safe).
+
+    Callers must maintain total_comments/total_videos/videos_completed
+    incrementally when adding videos; recomputing them here iterated every
+    video on every save.
+    """
     with lock:
-        # Update stats before saving
-        data["total_comments"] = sum(v.get("comment_count", 0) for v in data["videos"])
-        data["total_videos"] = len(data["videos"])
-        data["videos_completed"] = len(data["videos"])
         data["last_updated"] = datetime.now().isoformat()
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        _dump_json(filepath, data)
 
 
 def update_extraction_state(**kwargs):
-    """Update global extraction state."""
-    with extraction_lock:
+    """Update global extraction state and wake SSE subscribers."""
+    with extraction_condition:
         extraction_state.update(kwargs)
+        extraction_condition.notify_all()
 
 
 def reset_extraction_state():
     """Reset extraction state."""
-    with extraction_lock:
+    extraction_stop_event.clear()
+    with extraction_condition:
         extraction_state.update(
             {
                 "active": False,
@@ -324,6 +640,7 @@ def reset_extraction_state():
                 "filename": None,
             }
         )
+        extraction_condition.notify_all()
 
 
 def save_video_json(videos_dir, video_data, lock):
@@ -333,8 +650,8 @@ def save_video_json(videos_dir, video_data, lock):
         return
     filepath = os.path.join(videos_dir, f"{video_id}.json")
     with lock:
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(video_data, f, ensure_ascii=False, indent=2)
+        _dump_json(filepath, video_data)
+    _invalidate_cached_json(filepath)
 
 
 def save_channel_info(channel_dir, channel_info, videos_stats, lock):
@@ -346,8 +663,13 @@ def save_channel_info(channel_dir, channel_info, videos_stats, lock):
         info["total_videos"] = videos_stats.get("total_videos", 0)
         info["videos_extracted"] = videos_stats.get("videos_extracted", 0)
         info["total_comments"] = videos_stats.get("total_comments", 0)
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(info, f, ensure_ascii=False, indent=2)
+        _dump_json(filepath, info)
+    _invalidate_cached_json(filepath)
+
+
+# Strips everything but word characters (incl. accented letters), spaces,
+# @ and - from channel names; C-speed replacement for the per-character loop
+_FOLDER_RE = re.compile(r"[^\w @-]+")
 
 
 def do_extraction(channel_input, limit=None, skip_existing=False, workers=None):
@@ -361,6 +683,7 @@ def do_extraction(channel_input, limit=None, skip_existing=False, workers=None):
           <video_id>.json      <- One file per video
     """
     try:
+        extraction_stop_event.clear()
         update_extraction_state(active=True, stop_requested=False)
 
         videos, channel_info = get_channel_videos(channel_input)
@@ -373,9 +696,7 @@ def do_extraction(channel_input, limit=None, skip_existing=False, workers=None):
         if channel_input.startswith("@"):
             folder_name = channel_input  # Use @handle as folder name
         else:
-            folder_name = "".join(
-                c for c in channel_name if c.isalnum() or c in (" ", "-", "_", "@")
-            ).strip()
+            folder_name = _FOLDER_RE.sub("", channel_name).strip()
 
         # Create folder structure
         channel_dir = os.path.join(app.config["OUTPUT_DIR"], folder_name)
@@ -414,16 +735,29 @@ def do_extraction(channel_input, limit=None, skip_existing=False, workers=None):
         # Lock for thread-safe file writing
         file_lock = threading.Lock()
 
-        # Calculate existing comments count
+        # Calculate existing comments count from info.json, which already
+        # persists the totals; fall back to scanning per-video files only for
+        # channels extracted before info.json carried these keys
         existing_comments = 0
-        for vid_file in os.listdir(videos_dir) if os.path.exists(videos_dir) else []:
-            if vid_file.endswith(".json"):
-                try:
-                    with open(os.path.join(videos_dir, vid_file), "r") as f:
-                        vid_data = json.load(f)
+        info_path = os.path.join(channel_dir, "info.json")
+        info_has_totals = False
+        if os.path.exists(info_path):
+            try:
+                info_data = _cached_json(info_path)
+                if "total_comments" in info_data:
+                    existing_comments = info_data.get("total_comments", 0)
+                    info_has_totals = True
+            except Exception:
+                pass
+
+        if not info_has_totals:
+            for vid_file in os.listdir(videos_dir) if os.path.exists(videos_dir) else []:
+                if vid_file.endswith(".json"):
+                    try:
+                        vid_data = _cached_json(os.path.join(videos_dir, vid_file))
                         existing_comments += vid_data.get("comment_count", 0)
-                except Exception:
-                    pass
+                    except Exception:
+                        pass
 
         update_extraction_state(
             videos_total=len(videos),
@@ -440,6 +774,10 @@ def do_extraction(channel_input, limit=None, skip_existing=False, workers=None):
         save_channel_info(channel_dir, channel_info, videos_stats, file_lock)
 
         num_workers = min(workers or DEFAULT_WORKERS, MAX_WORKERS)
+
+        # More workers allow a proportionally higher global request rate
+        rate_limiter.min_interval = BASE_REQUEST_INTERVAL / num_workers
+
         print(
             f"Starting parallel extraction for {len(videos)} NEW videos with {num_workers} workers..."
         )
@@ -448,21 +786,36 @@ def do_extraction(channel_input, limit=None, skip_existing=False, workers=None):
         total_comments = existing_comments
         completed = 0
 
-        # Parallel extraction using ThreadPoolExecutor
-        with ThreadPoolExecutor(max_workers=num_workers) as executor:
-            future_to_video = {
-                executor.submit(scrape_video_comments, video): video for video in videos
-            }
+        # Parallel extraction on the shared module-level pool. Submissions are
+        # windowed to num_workers so the per-job worker setting still caps
+        # concurrency even though the pool itself is sized at MAX_WORKERS.
+        videos_iter = iter(videos)
+        pending_futures = set()
+
+        def submit_next_video():
+            video = next(videos_iter, None)
+            if video is not None:
+                pending_futures.add(video_executor.submit(scrape_video_comments, video))
+
+        for _ in range(num_workers):
+            submit_next_video()
+
+        rate_limit_hit = False
+        successful_videos = 0
+        last_info_save = time.monotonic()
+
+        while pending_futures:
+            done, pending_futures = wait(pending_futures, return_when=FIRST_COMPLETED)
 
-            rate_limit_hit = False
-            successful_videos = 0
+            # Check if stop was requested
+            if extraction_stop_event.is_set():
+                print("Stop requested, cancelling remaining tasks...")
+                for future in pending_futures:
+                    future.cancel()
+                break
 
-            for future in as_completed(future_to_video):
-                # Check if stop was requested
-                if extraction_state["stop_requested"]:
-                    print("Stop requested, cancelling remaining tasks...")
-                    executor.shutdown(wait=False, cancel_futures=True)
-                    break
+            for future in done:
+                submit_next_video()
 
                 completed += 1
                 result = future.result()
@@ -479,7 +832,9 @@ def do_extraction(channel_input, limit=None, skip_existing=False, workers=None):
                         print("\n⚠️  RATE LIMIT DETECTED (403 Forbidden)")
                         print("YouTube is blocking requests. Stopping extraction...")
                         rate_limit_hit = True
-                        executor.shutdown(wait=False, cancel_futures=True)
+                        for pending in pending_futures:
+                            pending.cancel()
+                        pending_futures = set()
                         break
 
                     # Don't save videos with errors
@@ -493,14 +848,18 @@ def do_extraction(channel_input, limit=None, skip_existing=False, workers=None):
                 save_video_json(videos_dir, result, file_lock)
                 successful_videos += 1
 
-                # Update stats
+                # Update stats (rewrite info.json at most every few seconds
+                # rather than per video; final totals are written after the
+                # loop)
                 total_comments += result.get("comment_count", 0)
                 videos_stats = {
                     "total_videos": total_available,
                     "videos_extracted": existing_count + successful_videos,
                     "total_comments": total_comments,
                 }
-                save_channel_info(channel_dir, channel_info, videos_stats, file_lock)
+                if time.monotonic() - last_info_save > 5:
+                    save_channel_info(channel_dir, channel_info, videos_stats, file_lock)
+                    last_info_save = time.monotonic()
 
                 # Update global state
                 update_extraction_state(
@@ -509,10 +868,21 @@ def do_extraction(channel_input, limit=None, skip_existing=False, workers=None):
                     comments_extracted=total_comments,
                 )
 
+            if rate_limit_hit:
+                break
+
         # Final stats
-        was_stopped = extraction_state["stop_requested"]
+        was_stopped = extraction_stop_event.is_set()
         final_video_count = existing_count + successful_videos
 
+        # Persist final totals (the in-loop saves are throttled)
+        videos_stats = {
+            "total_videos": total_available,
+            "videos_extracted": final_video_count,
+            "total_comments": total_comments,
+        }
+        save_channel_info(channel_dir, channel_info, videos_stats, file_lock)
+
         if rate_limit_hit:
             print(f"\n⚠️  Extraction stopped due to rate limiting!")
             print(
@@ -548,62 +918,72 @@ def do_extraction(channel_input, limit=None, skip_existing=False, workers=None):
         return {"error": str(e)}
 
 
+def _run_extraction_job(job):
+    """Run one queued extraction job and record its outcome."""
+    job_id, channel_input, limit, skip_existing, workers = job
+
+    # Update queue status
+    with queue_lock:
+        item = queue_index[job_id]
+        item["status"] = "running"
+        _stamp_queue_entry(item)
+
+    # Do the extraction
+    result = do_extraction(channel_input, limit, skip_existing, workers)
+
+    # Update queue status
+    with queue_lock:
+        item = queue_index[job_id]
+        item["status"] = "completed" if result.get("success") else "error"
+        item["result"] = result
+        _stamp_queue_entry(item)
+
+
 def queue_worker():
-    """Background worker to process extraction queue."""
+    """Dispatch extraction queue items onto the shared job pool."""
     while True:
         job = extraction_queue.get()
         if job is None:
             break
 
-        job_id, channel_input, limit, skip_existing, workers = job
+        # Wait for completion before pulling the next item: extraction jobs
+        # share the global extraction_state and must stay FIFO
+        job_executor.submit(_run_extraction_job, job).result()
+        extraction_queue.task_done()
 
-        # Update queue status
-        with queue_lock:
-            for item in queue_list:
-                if item["id"] == job_id:
-                    item["status"] = "running"
-                    break
 
-        # Do the extraction
-        result = do_extraction(channel_input, limit, skip_existing, workers)
+# Start the queue dispatcher thread
+queue_thread = threading.Thread(target=queue_worker, daemon=True)
+queue_thread.start()
 
-        # Update queue status
-        with queue_lock:
-            for item in queue_list:
-                if item["id"] == job_id:
-                    item["status"] = "completed" if result.get("success") else "error"
-                    item["result"] = result
-                    break
 
-        extraction_queue.task_done()
+def _run_modeling_job(job):
+    """Run one queued topic modeling job."""
+    job_id, channels, algorithm, params = job
 
+    # Update job status
+    with modeling_jobs_lock:
+        job_entry = modeling_jobs.get(job_id)
+        if job_entry is not None:
+            job_entry["status"] = "running"
 
-# Start the queue worker thread
-queue_thread = threading.Thread(target=queue_worker, daemon=True)
-queue_thread.start()
+    # Do the topic modeling
+    do_topic_modeling(job_id, channels, algorithm, params)
 
 
 def modeling_worker():
-    """Background worker to process topic modeling queue."""
+    """Dispatch topic modeling queue items onto the shared job pool."""
     while True:
         job = modeling_queue.get()
         if job is None:
             break
 
-        job_id, channels, algorithm, params = job
-
-        # Update job status
-        with modeling_jobs_lock:
-            if job_id in modeling_jobs:
-                modeling_jobs[job_id]["status"] = "running"
-
-        # Do the topic modeling
-        result = do_topic_modeling(job_id, channels, algorithm, params)
-
+        # Modeling jobs share the global modeling_state; keep them FIFO
+        job_executor.submit(_run_modeling_job, job).result()
         modeling_queue.task_done()
 
 
-# Start the modeling worker thread
+# Start the modeling dispatcher thread
 modeling_thread = threading.Thread(target=modeling_worker, daemon=True)
 modeling_thread.start()
 
@@ -634,9 +1014,10 @@ def scrape_comments():
 
         # Add to queue
         with queue_lock:
-            queue_list.append(
-                {"id": job_id, "channel": channel, "status": "queued", "result": None}
-            )
+            entry = {"id": job_id, "channel": channel, "status": "queued", "result": None}
+            _stamp_queue_entry(entry)
+            queue_list.append(entry)
+            queue_index[job_id] = entry
 
         extraction_queue.put(job)
         job_ids.append(job_id)
@@ -652,16 +1033,56 @@ def scrape_comments():
     )
 
 
-@app.route("/api/extraction-status")
-def get_extraction_status():
-    """Get current extraction status for real-time progress."""
+def _extraction_status_snapshot(since=None):
+    """Copy the current extraction state plus queue under their locks.
+
+    With a since cursor, only queue entries stamped after it are included,
+    making repeated status reads O(changes) rather than O(queue).
+    """
     with extraction_lock:
         status = extraction_state.copy()
 
     with queue_lock:
-        status["queue"] = queue_list.copy()
+        if since is None:
+            status["queue"] = queue_list.copy()
+        else:
+            status["queue"] = [item for item in queue_list if item["seq"] > since]
+        status["queue_max_seq"] = queue_max_seq
+
+    return status
+
+
+@app.route("/api/extraction-status")
+def get_extraction_status():
+    """Get current extraction status for real-time progress.
+
+    Pass ?since=<queue_max_seq from the previous response> to receive only
+    queue entries that changed since then. Polling without it still returns
+    the full queue; prefer the push-based /api/extraction-stream endpoint.
+    """
+    since = request.args.get("since", type=int)
+    return jsonify(_extraction_status_snapshot(since))
 
-    return jsonify(status)
+
+@app.route("/api/extraction-stream")
+def extraction_stream():
+    """Push extraction status over Server-Sent Events.
+
+    Emits a snapshot immediately, then one per state change (with a 15s
+    heartbeat so proxies don't drop the idle connection). Clients consume it
+    with EventSource instead of polling /api/extraction-status.
+    """
+
+    def generate():
+        last_seq = None  # first message carries the full queue
+        while True:
+            snapshot = _extraction_status_snapshot(last_seq)
+            last_seq = snapshot["queue_max_seq"]
+            yield f"data: {json.dumps(snapshot)}\n\n"
+            with extraction_condition:
+                extraction_condition.wait(timeout=15)
+
+    return Response(stream_with_context(generate()), mimetype="text/event-stream")
 
 
 @app.route("/api/stop-extraction", methods=["POST"])
@@ -670,6 +1091,7 @@ def stop_extraction():
     with extraction_lock:
         if extraction_state["active"]:
             extraction_state["stop_requested"] = True
+            extraction_stop_event.set()
             return jsonify({"success": True, "message": "Stop requested"})
         else:
             return jsonify({"success": False, "message": "No extraction in progress"})
@@ -682,6 +1104,8 @@ def clear_queue():
         queue_list[:] = [
             item for item in queue_list if item["status"] in ("queued", "running")
         ]
+        queue_index.clear()
+        queue_index.update((item["id"], item) for item in queue_list)
     return jsonify({"success": True})
 
 
@@ -694,6 +1118,15 @@ def download_file(filename):
     return jsonify({"error": "Fichier non trouvé"}), 404
 
 
+def _format_size(size):
+    """Format a byte count for display (B / KB / MB)."""
+    if size < 1024:
+        return f"{size} B"
+    if size < 1024 * 1024:
+        return f"{size / 1024:.1f} KB"
+    return f"{size / (1024 * 1024):.1f} MB"
+
+
 @app.route("/api/files")
 def list_files():
     """Lister tous les fichiers JSON disponibles."""
@@ -701,26 +1134,73 @@ def list_files():
     output_dir = app.config["OUTPUT_DIR"]
 
     if os.path.exists(output_dir):
-        for filename in os.listdir(output_dir):
-            if filename.endswith(".json"):
-                filepath = os.path.join(output_dir, filename)
-                size = os.path.getsize(filepath)
-                # Formater la taille
-                if size < 1024:
-                    size_str = f"{size} B"
-                elif size < 1024 * 1024:
-                    size_str = f"{size / 1024:.1f} KB"
-                else:
-                    size_str = f"{size / (1024 * 1024):.1f} MB"
-
-                files.append({"name": filename, "size": size_str, "path": filepath})
+        with os.scandir(output_dir) as it:
+            for entry in it:
+                if entry.name.endswith(".json"):
+                    stat = entry.stat()
+                    files.append(
+                        {
+                            "name": entry.name,
+                            "size": _format_size(stat.st_size),
+                            "path": entry.path,
+                            "_mtime": stat.st_mtime,
+                        }
+                    )
 
     # Trier par date de modification (plus récent en premier)
-    files.sort(key=lambda x: os.path.getmtime(x["path"]), reverse=True)
+    files.sort(key=lambda x: x.pop("_mtime"), reverse=True)
 
     return jsonify({"files": files})
 
 
+def _scan_channel(dir_entry):
+    """Build the stats dict for one channel folder (used by files-stats)."""
+    folder_name = dir_entry.name
+    channel_dir = dir_entry.path
+    info_path = os.path.join(channel_dir, "info.json")
+
+    channel_info = {
+        "folder": folder_name,
+        "channel_name": folder_name,
+        "video_count": 0,
+        "comment_count": 0,
+        "subscriber_count": None,
+        "last_updated": "",
+        "size": "0 B",
+    }
+
+    # One stat covers both the existence check and the size below
+    try:
+        info_size = os.stat(info_path).st_size
+    except OSError:
+        info_size = None
+
+    # Read info.json if exists (cached, invalidated by mtime)
+    if info_size is not None:
+        try:
+            data = _cached_json(info_path)
+            channel_info["channel_name"] = data.get("channel_name", folder_name)
+            channel_info["channel_id"] = data.get("channel_id", "")
+            channel_info["description"] = data.get("description", "")
+            channel_info["subscriber_count"] = data.get("subscriber_count")
+            channel_info["video_count"] = data.get("videos_extracted", 0)
+            channel_info["total_videos_available"] = data.get("total_videos", 0)
+            channel_info["comment_count"] = data.get("total_comments", 0)
+            channel_info["last_updated"] = data.get("last_updated", "")
+        except Exception:
+            pass
+
+    # Calculate folder size (cached per videos dir)
+    videos_dir = os.path.join(channel_dir, "videos")
+    folder_size, _ = _videos_dir_stats(videos_dir)
+    if info_size is not None:
+        folder_size += info_size
+
+    channel_info["size"] = _format_size(folder_size)
+
+    return channel_info
+
+
 @app.route("/api/files-stats")
 def list_files_with_stats():
     """List all channels with their statistics (new folder structure)."""
@@ -730,68 +1210,21 @@ def list_files_with_stats():
     total_comments = 0
 
     if os.path.exists(output_dir):
-        for folder_name in os.listdir(output_dir):
-            channel_dir = os.path.join(output_dir, folder_name)
-            info_path = os.path.join(channel_dir, "info.json")
-
-            # Skip if not a directory or no info.json
-            if not os.path.isdir(channel_dir):
-                continue
-
-            channel_info = {
-                "folder": folder_name,
-                "channel_name": folder_name,
-                "video_count": 0,
-                "comment_count": 0,
-                "subscriber_count": None,
-                "last_updated": "",
-                "size": "0 B",
-            }
-
-            # Read info.json if exists
-            if os.path.exists(info_path):
-                try:
-                    with open(info_path, "r", encoding="utf-8") as f:
-                        data = json.load(f)
-                        channel_info["channel_name"] = data.get(
-                            "channel_name", folder_name
-                        )
-                        channel_info["channel_id"] = data.get("channel_id", "")
-                        channel_info["description"] = data.get("description", "")
-                        channel_info["subscriber_count"] = data.get("subscriber_count")
-                        channel_info["video_count"] = data.get("videos_extracted", 0)
-                        channel_info["total_videos_available"] = data.get(
-                            "total_videos", 0
-                        )
-                        channel_info["comment_count"] = data.get("total_comments", 0)
-                        channel_info["last_updated"] = data.get("last_updated", "")
-                except Exception:
-                    pass
-
-            # Calculate folder size
-            videos_dir = os.path.join(channel_dir, "videos")
-            folder_size = 0
-            if os.path.exists(videos_dir):
-                for f in os.listdir(videos_dir):
-                    fp = os.path.join(videos_dir, f)
-                    if os.path.isfile(fp):
-                        folder_size += os.path.getsize(fp)
-            if os.path.exists(info_path):
-                folder_size += os.path.getsize(info_path)
-
-            if folder_size < 1024:
-                channel_info["size"] = f"{folder_size} B"
-            elif folder_size < 1024 * 1024:
-                channel_info["size"] = f"{folder_size / 1024:.1f} KB"
-            else:
-                channel_info["size"] = f"{folder_size / (1024 * 1024):.1f} MB"
+        with os.scandir(output_dir) as it:
+            folders = [e for e in it if e.is_dir(follow_symlinks=False)]
+
+        if len(folders) > 1:
+            # Overlap the per-channel directory walks; steady state is served
+            # from the mtime caches, but cold scans are I/O-bound
+            with ThreadPoolExecutor(max_workers=min(16, len(folders))) as pool:
+                channels_list = list(pool.map(_scan_channel, folders))
+        else:
+            channels_list = [_scan_channel(e) for e in folders]
 
-            # Accumulate global stats
+        for channel_info in channels_list:
             total_videos += channel_info["video_count"]
             total_comments += channel_info["comment_count"]
 
-            channels_list.append(channel_info)
-
     # Sort by last updated (most recent first)
     channels_list.sort(key=lambda x: x.get("last_updated", ""), reverse=True)
 
@@ -805,6 +1238,10 @@ def list_files_with_stats():
     )
 
 
+# Pulls comment_count out of a raw video file without a full JSON parse
+_COMMENT_COUNT_RE = re.compile(rb'"comment_count":\s*(\d+)')
+
+
 @app.route("/api/file-detail/<folder>")
 def get_file_detail(folder):
     """Get detailed content for a channel folder (new structure)."""
@@ -816,42 +1253,122 @@ def get_file_detail(folder):
         return jsonify({"error": "Channel folder not found"}), 404
 
     try:
-        # Load channel info
+        # Load channel info (cached, invalidated by mtime)
         channel_info = {}
         if os.path.exists(info_path):
-            with open(info_path, "r", encoding="utf-8") as f:
-                channel_info = json.load(f)
+            channel_info = _cached_json(info_path)
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+    header = {
+        "channel_name": channel_info.get("channel_name", folder),
+        "channel_id": channel_info.get("channel_id", ""),
+        "description": channel_info.get("description", ""),
+        "subscriber_count": channel_info.get("subscriber_count"),
+        "last_updated": channel_info.get("last_updated", ""),
+    }
+
+    def generate():
+        # Stream the response instead of materializing every video in RAM:
+        # the on-disk per-video files are already valid UTF-8 JSON objects,
+        # so their raw bytes are concatenated as-is -- no TextIOWrapper
+        # decode and no parse/re-encode round trip. Totals are only known
+        # after the scan, so they trail the array (JSON object key order is
+        # irrelevant to the frontend).
+        yield (json.dumps(header, ensure_ascii=False)[:-1] + ',"videos":[').encode(
+            "utf-8"
+        )
 
-        # Load all videos
-        videos = []
+        video_count = 0
         total_comments = 0
         if os.path.exists(videos_dir):
-            for video_file in os.listdir(videos_dir):
-                if video_file.endswith(".json"):
-                    video_path = os.path.join(videos_dir, video_file)
-                    try:
-                        with open(video_path, "r", encoding="utf-8") as f:
-                            video_data = json.load(f)
-                            videos.append(video_data)
-                            total_comments += video_data.get("comment_count", 0)
-                    except Exception:
-                        pass
+            for entry in os.scandir(videos_dir):
+                if not entry.name.endswith(".json"):
+                    continue
+                try:
+                    with open(entry.path, "rb") as f:
+                        raw = f.read()
+                except OSError:
+                    continue
 
-        # Build response matching old format for frontend compatibility
-        result = {
-            "channel_name": channel_info.get("channel_name", folder),
-            "channel_id": channel_info.get("channel_id", ""),
-            "description": channel_info.get("description", ""),
-            "subscriber_count": channel_info.get("subscriber_count"),
-            "last_updated": channel_info.get("last_updated", ""),
-            "total_videos": len(videos),
-            "total_comments": total_comments,
-            "videos": videos,
-        }
+                match = _COMMENT_COUNT_RE.search(raw)
+                if match:
+                    total_comments += int(match.group(1))
+
+                if video_count:
+                    yield b","
+                yield raw
+                video_count += 1
 
-        return jsonify(result)
+        yield f'],"total_videos":{video_count},"total_comments":{total_comments}}}'.encode(
+            "utf-8"
+        )
+
+    return Response(stream_with_context(generate()), mimetype="application/json")
+
+
+@dataclass(slots=True)
+class CommentMeta:
+    """Per-comment metadata row.
+
+    A slotted dataclass instead of a dict: six fields cost a fraction of a
+    dict's per-instance overhead (no hash table per comment), and attribute
+    access is a C-level offset load. orjson serializes dataclasses natively;
+    use dataclasses.asdict at dict-expecting boundaries.
+    """
+
+    channel: str
+    video_id: str
+    video_title: str
+    author: str
+    likes: int
+    timestamp: str
+
+
+def _load_video_file(arg):
+    """Load one video file into (comments, metadata) lists."""
+    channel, video_path = arg
+    local_comments = []
+    local_metadata = []
+
+    try:
+        # orjson parses the raw bytes several times faster than stdlib json
+        # going through a TextIOWrapper
+        with open(video_path, "rb") as f:
+            raw = f.read()
+        video_data = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+        # Multi-MB for busy videos: release the file buffer before building
+        # per-comment rows so it and the parsed tree don't peak together
+        del raw
+
+        # Per-video fields are constant across its comments; intern them so
+        # the thousands of metadata rows share one string object each and
+        # downstream equality checks are pointer compares
+        channel_name = sys.intern(channel)
+        video_id = sys.intern(video_data.get("video_id") or "")
+        video_title = sys.intern(video_data.get("title") or "")
+
+        # Extract comments in two comprehensions (C-level list growth
+        # instead of interpreted append calls per comment)
+        comments_list = video_data.get("comments", [])
+        local_comments = [comment["text"] for comment in comments_list]
+        local_metadata = [
+            CommentMeta(
+                channel=channel_name,
+                video_id=video_id,
+                video_title=video_title,
+                author=comment.get("author"),
+                likes=comment.get("likes", 0),
+                timestamp=comment.get("timestamp"),
+            )
+            for comment in comments_list
+        ]
     except Exception as e:
-        return jsonify({"error": str(e)}), 500
+        print(f"Error loading {os.path.basename(video_path)}: {e}")
+        # Never return partial lists: comments and metadata must stay aligned
+        return [], []
+
+    return local_comments, local_metadata
 
 
 def load_comments_from_channels(channels: list) -> tuple:
@@ -860,37 +1377,31 @@ def load_comments_from_channels(channels: list) -> tuple:
     all_metadata = []
     output_dir = app.config["OUTPUT_DIR"]
 
+    video_paths = []
     for channel in channels:
-        channel_dir = os.path.join(output_dir, channel)
-        videos_dir = os.path.join(channel_dir, "videos")
+        videos_dir = os.path.join(output_dir, channel, "videos")
 
         if not os.path.exists(videos_dir):
             print(f"[WARNING] Channel '{channel}' has no videos/ folder - skipping")
             continue
 
-        # Load all video files
-        for video_file in os.listdir(videos_dir):
-            if video_file.endswith(".json"):
-                video_path = os.path.join(videos_dir, video_file)
-                try:
-                    with open(video_path, "r", encoding="utf-8") as f:
-                        video_data = json.load(f)
-
-                        # Extract comments
-                        for comment in video_data.get("comments", []):
-                            all_comments.append(comment["text"])
-                            all_metadata.append(
-                                {
-                                    "channel": channel,
-                                    "video_id": video_data.get("video_id"),
-                                    "video_title": video_data.get("title"),
-                                    "author": comment.get("author"),
-                                    "likes": comment.get("likes", 0),
-                                    "timestamp": comment.get("timestamp"),
-                                }
-                            )
-                except Exception as e:
-                    print(f"Error loading {video_file}: {e}")
+        with os.scandir(videos_dir) as it:
+            video_paths.extend(
+                (channel, entry.path)
+                for entry in it
+                if entry.name.endswith(".json") and entry.is_file(follow_symlinks=False)
+            )
+
+    if not video_paths:
+        return all_comments, all_metadata
+
+    # Overlap file reads and JSON decode across videos; results are extended
+    # into the master lists in deterministic ex.map order
+    max_workers = min(os.cpu_count() or 4, len(video_paths))
+    with ThreadPoolExecutor(max_workers=max_workers) as ex:
+        for comments, metadata in ex.map(_load_video_file, video_paths):
+            all_comments.extend(comments)
+            all_metadata.extend(metadata)
 
     return all_comments, all_metadata
 
@@ -910,17 +1421,14 @@ def do_topic_modeling(job_id: str, channels: list, algorithm: str, params: dict)
 
     try:
         # Update state
-        with modeling_lock:
-            modeling_state.update(
-                {
-                    "active": True,
-                    "current_job_id": job_id,
-                    "stage": "loading",
-                    "progress": 0,
-                    "message": "Loading comments...",
-                    "channels": channels,
-                }
-            )
+        _update_modeling_state(
+            active=True,
+            current_job_id=job_id,
+            stage="loading",
+            progress=0,
+            message="Loading comments...",
+            channels=channels,
+        )
 
         print(f"[MODELING] State updated, progress=0")
 
@@ -935,36 +1443,34 @@ def do_topic_modeling(job_id: str, channels: list, algorithm: str, params: dict)
                 f"No comments found in specified channels: {channels}. Make sure these channels have extracted videos with comments."
             )
 
-        with modeling_lock:
-            modeling_state.update(
-                {
-                    "total_comments": len(comments),
-                    "progress": 10,
-                    "message": f"Loaded {len(comments)} comments",
-                }
-            )
+        _update_modeling_state(
+            total_comments=len(comments),
+            progress=10,
+            message=f"Loaded {len(comments)} comments",
+        )
 
         print(f"[MODELING] Progress updated to 10%")
 
-        # Progress callback
+        # Progress callback, coalesced: preprocessor/model internals fire it
+        # per step, so publish at most every 250ms (plus the terminal update)
+        last_progress_update = [0.0]
+
         def progress_callback(progress, message):
-            with modeling_lock:
-                modeling_state.update(
-                    {
-                        "progress": int(20 + (progress * 0.5)),  # 20-70%
-                        "message": message,
-                    }
-                )
+            now = time.monotonic()
+            if progress < 100 and now - last_progress_update[0] < 0.25:
+                return
+            last_progress_update[0] = now
+            _update_modeling_state(
+                progress=int(20 + (progress * 0.5)),  # 20-70%
+                message=message,
+            )
 
         # Preprocess comments
-        with modeling_lock:
-            modeling_state.update(
-                {
-                    "stage": "preprocessing",
-                    "progress": 20,
-                    "message": "Preprocessing comments...",
-                }
-            )
+        _update_modeling_state(
+            stage="preprocessing",
+            progress=20,
+            message="Preprocessing comments...",
+        )
 
         language = params.get("language", "auto")
         print(f"[MODELING] Creating TextPreprocessor with language={language}")
@@ -982,26 +1488,34 @@ def do_topic_modeling(job_id: str, channels: list, algorithm: str, params: dict)
 
         print(f"[MODELING] Starting batch processing of {len(comments)} comments...")
         try:
-            processed_comments = preprocessor.process_batch(
+            processed_arr, processed_lens = preprocessor.process_batch_to_array(
                 comments, detect_language=(language == "auto")
             )
             print(
-                f"[MODELING] Batch processing complete: {len(processed_comments)} processed"
+                f"[MODELING] Batch processing complete: {len(processed_arr)} processed"
             )
         except Exception as e:
             print(f"[MODELING] ERROR during batch processing: {e}")
             raise
 
-        # Filter empty documents
+        # Filter empty documents with a single boolean mask applied to all
+        # three aligned lists (C-level gather instead of three Python loops).
+        # Processed texts carry no surrounding whitespace, so length > 0 is
+        # the emptiness test and the mask is one vectorized compare.
         print(f"[MODELING] Filtering empty documents...")
-        valid_indices = [i for i, doc in enumerate(processed_comments) if doc.strip()]
-        processed_comments = [processed_comments[i] for i in valid_indices]
-        comments = [
-            comments[i] for i in valid_indices
-        ]  # Keep comments aligned with processed_comments
-        metadata = [metadata[i] for i in valid_indices]
+        mask = processed_lens > 0
+        processed_comments = processed_arr[mask].tolist()
+        # Keep comments and metadata aligned with processed_comments
+        comments = np.asarray(comments, dtype=object)[mask].tolist()
+        metadata = np.asarray(metadata, dtype=object)[mask].tolist()
         print(f"[MODELING] After filtering: {len(processed_comments)} valid documents")
 
+        # Hot metadata fields as struct-of-arrays: the persistence path reads
+        # channel/video_id per sparse (doc, topic) pair, and object-array
+        # indexing there is one C-level fetch instead of two dict lookups
+        meta_channels = np.array([m.channel for m in metadata], dtype=object)
+        meta_video_ids = np.array([m.video_id for m in metadata], dtype=object)
+
         if len(processed_comments) < params.get("num_topics", 5):
             print(f"[MODELING] ERROR: Too few valid documents!")
             raise ValueError(
@@ -1010,14 +1524,11 @@ def do_topic_modeling(job_id: str, channels: list, algorithm: str, params: dict)
 
         # Train model
         print(f"[MODELING] Starting model training with {algorithm.upper()}...")
-        with modeling_lock:
-            modeling_state.update(
-                {
-                    "stage": "training",
-                    "progress": 70,
-                    "message": f"Training {algorithm.upper()} model...",
-                }
-            )
+        _update_modeling_state(
+            stage="training",
+            progress=70,
+            message=f"Training {algorithm.upper()} model...",
+        )
 
         if algorithm == "lda":
             model = LDAModel(
@@ -1038,26 +1549,28 @@ def do_topic_modeling(job_id: str, channels: list, algorithm: str, params: dict)
 
         # Get representative documents for each topic
         print("[MODELING] Step A: Updating state to finalizing...")
-        with modeling_lock:
-            modeling_state.update(
-                {
-                    "stage": "finalizing",
-                    "progress": 90,
-                    "message": "Finalizing results...",
-                }
-            )
+        _update_modeling_state(
+            stage="finalizing",
+            progress=90,
+            message="Finalizing results...",
+        )
 
         print("[MODELING] Step B: Getting representative documents...")
+        # Top-5 documents for all topics come from one argpartition pass
+        # instead of a per-topic argsort over the whole matrix
+        rep_matrix = model.get_all_representative_document_indices(n=5)
         for topic in model.topics:
-            topic["representative_comments"] = model.get_representative_documents(
-                comments, int(topic["id"]), n=5
+            rep_indices = (
+                rep_matrix[:, int(topic["id"])].tolist() if rep_matrix.size else []
             )
+            topic["representative_indices"] = rep_indices
+            topic["representative_comments"] = [
+                comments[idx] for idx in rep_indices if 0 <= idx < len(comments)
+            ]
         print("[MODELING] Step C: Representative documents done")
 
         # Prepare results
         print("[MODELING] Step D: Preparing results dict...")
-        print("[MODELING] Step D1: document_topics.tolist()...")
-        doc_topics_list = model.document_topics.tolist()
         print("[MODELING] Step D2: get_topic_diversity()...")
         diversity = model.get_topic_diversity()
         print("[MODELING] Step D3: get_model_info()...")
@@ -1075,7 +1588,9 @@ def do_topic_modeling(job_id: str, channels: list, algorithm: str, params: dict)
             "valid_comments": len(processed_comments),
             "channels": channels,
             "topics": model.topics,
-            "document_topics": doc_topics_list,
+            # Kept as the ndarray; the results endpoint serializes it
+            # straight from the C buffer (orjson OPT_SERIALIZE_NUMPY)
+            "document_topics": model.document_topics,
             "metadata": metadata,
             "diversity": diversity,
             "model_info": model_info,
@@ -1089,11 +1604,7 @@ def do_topic_modeling(job_id: str, channels: list, algorithm: str, params: dict)
         # F1. Sentiment Analysis
         try:
             print("[MODELING] Step F1: Calculating sentiment analysis...")
-            with modeling_lock:
-                modeling_state.update({
-                    "progress": 92,
-                    "message": "Analyzing sentiment..."
-                })
+            _update_modeling_state(progress=92, message="Analyzing sentiment...")
 
             sentiment_analyzer = SentimentAnalyzer(method='textblob')
             sentiment_results = sentiment_analyzer.analyze_topic_sentiments(
@@ -1110,11 +1621,9 @@ def do_topic_modeling(job_id: str, channels: list, algorithm: str, params: dict)
         # F2. Coherence Scores
         try:
             print("[MODELING] Step F2: Calculating coherence scores...")
-            with modeling_lock:
-                modeling_state.update({
-                    "progress": 94,
-                    "message": "Calculating topic coherence..."
-                })
+            _update_modeling_state(
+                progress=94, message="Calculating topic coherence..."
+            )
 
             # Extract topics as list of word lists
             topics_words = [[word for word in topic['words'][:10]] for topic in model.topics]
@@ -1146,11 +1655,9 @@ def do_topic_modeling(job_id: str, channels: list, algorithm: str, params: dict)
         # F3. Inter-topic Distances
         try:
             print("[MODELING] Step F3: Calculating inter-topic distances...")
-            with modeling_lock:
-                modeling_state.update({
-                    "progress": 96,
-                    "message": "Calculating topic distances..."
-                })
+            _update_modeling_state(
+                progress=96, message="Calculating topic distances..."
+            )
 
             # Get topic-term matrix from model
             if hasattr(model, 'model') and hasattr(model.model, 'components_'):
@@ -1208,80 +1715,127 @@ def do_topic_modeling(job_id: str, channels: list, algorithm: str, params: dict)
                         'document_count': topic.get('document_count', 0),
                         'words': topic.get('words', []),
                         'representative_comments': topic.get('representative_comments', []),
-                        'metadata': [metadata[i] for i, _ in enumerate(topic.get('representative_comments', [])[:5])] if len(metadata) > 0 else []
+                        'metadata': [
+                            asdict(metadata[idx])
+                            for idx in topic.get('representative_indices', [])
+                            if 0 <= idx < len(metadata)
+                        ]
                     }
                     topics_data.append(topic_data)
-                db_manager.save_topics(job_id, topics_data)
 
                 # 3. Save document-topic probabilities (sparse, only prob > 0.01)
-                doc_topics_sparse = []
-                for doc_idx, doc_probs in enumerate(model.document_topics):
-                    for topic_num, prob in enumerate(doc_probs):
-                        if prob > 0.01:  # Only store significant probabilities
-                            doc_topics_sparse.append({
-                                'document_index': doc_idx,
-                                'topic_number': topic_num,
-                                'probability': float(prob),
-                                'channel': metadata[doc_idx].get('channel') if doc_idx < len(metadata) else None,
-                                'video_id': metadata[doc_idx].get('video_id') if doc_idx < len(metadata) else None
-                            })
-                db_manager.save_document_topics_batch(job_id, doc_topics_sparse)
-
-                # 4. Save preprocessing stats
-                db_manager.save_preprocessing_stats(job_id, {
-                    'original_comments': preprocessing_stats.get('original_documents', len(comments)),
-                    'valid_comments': preprocessing_stats.get('processed_documents', len(processed_comments)),
-                    'filtered_comments': preprocessing_stats.get('empty_documents', 0),
-                    'avg_length_original': preprocessing_stats.get('avg_length_original', 0),
-                    'avg_length_processed': preprocessing_stats.get('avg_tokens_per_doc', 0),
-                    'total_vocabulary': model_info.get('num_features', 0),
-                    'language_distribution': {},  # To be enhanced with actual language detection
-                    'most_common_words': None
-                })
-
-                # 5. Save model metadata
-                db_manager.save_model_metadata(job_id, {
-                    'vocabulary_size': model_info.get('num_features', 0),
-                    'max_iter': model_info.get('max_iter', params.get('max_iter', 20)),
-                    'perplexity': model_info.get('perplexity'),
-                    'reconstruction_error': model_info.get('reconstruction_error'),
-                    'training_time_seconds': None  # To be added with timing
-                })
-
-                # 6. Save sentiment analysis results
-                if results.get('sentiment_analysis'):
-                    try:
-                        db_manager.save_sentiment_analysis(job_id, results['sentiment_analysis'])
-                        print(f"[DATABASE] Saved sentiment analysis for {len(results['sentiment_analysis'])} topics")
-                    except Exception as e:
-                        print(f"[DATABASE] Warning: Failed to save sentiment analysis: {e}")
-
-                # 7. Save coherence scores
-                if results.get('coherence_scores'):
-                    try:
+                # One vectorized pass extracts all significant (doc, topic)
+                # pairs instead of N_docs x K_topics Python conditionals
+                dt = np.asarray(model.document_topics)
+                rows, cols = np.nonzero(dt > 0.01)
+                probs = dt[rows, cols]
+                # Metadata is aligned with the matrix by construction (the
+                # empty-document mask filtered all three arrays together),
+                # so gather both fields for all pairs without a per-row
+                # bounds check
+                assert len(meta_channels) == dt.shape[0], (
+                    f"metadata ({len(meta_channels)}) out of step with "
+                    f"document_topics ({dt.shape[0]})"
+                )
+                pair_channels = meta_channels[rows]
+                pair_video_ids = meta_video_ids[rows]
+                # Steps 2-8 write to independent tables, so run them on a
+                # small pool: the network-bound inserts overlap and finalize
+                # time drops from the sum of latencies towards the max
+                with ThreadPoolExecutor(
+                    max_workers=4, thread_name_prefix="persist"
+                ) as pool:
+                    required = [
+                        # 2. Save topics
+                        pool.submit(db_manager.save_topics, job_id, topics_data),
+                        # 3. Save document-topic probabilities straight from
+                        # the sparse arrays (no per-pair dicts)
+                        pool.submit(
+                            db_manager.save_document_topics_arrays,
+                            job_id,
+                            rows,
+                            cols,
+                            probs,
+                            pair_channels,
+                            pair_video_ids,
+                        ),
+                        # 4. Save preprocessing stats
+                        pool.submit(db_manager.save_preprocessing_stats, job_id, {
+                            'original_comments': preprocessing_stats.get('original_documents', len(comments)),
+                            'valid_comments': preprocessing_stats.get('processed_documents', len(processed_comments)),
+                            'filtered_comments': preprocessing_stats.get('empty_documents', 0),
+                            'avg_length_original': preprocessing_stats.get('avg_length_original', 0),
+                            'avg_length_processed': preprocessing_stats.get('avg_tokens_per_doc', 0),
+                            'total_vocabulary': model_info.get('num_features', 0),
+                            'language_distribution': {},  # To be enhanced with actual language detection
+                            'most_common_words': None
+                        }),
+                        # 5. Save model metadata
+                        pool.submit(db_manager.save_model_metadata, job_id, {
+                            'vocabulary_size': model_info.get('num_features', 0),
+                            'max_iter': model_info.get('max_iter', params.get('max_iter', 20)),
+                            'perplexity': model_info.get('perplexity'),
+                            'reconstruction_error': model_info.get('reconstruction_error'),
+                            'training_time_seconds': None  # To be added with timing
+                        }),
+                    ]
+
+                    for future in required:
+                        future.result()
+
+                    # 6-8. Enhanced-analysis tables are best-effort: a
+                    # failure is logged without failing the whole persist.
+                    # Sentiment and coherence resolve against the topics
+                    # rows, so these run only after the required saves land
+                    optional = []
+                    if results.get('sentiment_analysis'):
+                        optional.append((
+                            f"sentiment analysis for {len(results['sentiment_analysis'])} topics",
+                            pool.submit(db_manager.save_topic_sentiments, job_id, results['sentiment_analysis']),
+                        ))
+                    if results.get('coherence_scores'):
                         coherence_data = results['coherence_scores']
-                        db_manager.save_coherence_scores(job_id, coherence_data)
-                        print(f"[DATABASE] Saved coherence scores (overall={coherence_data.get('coherence_score', 0):.4f})")
-                    except Exception as e:
-                        print(f"[DATABASE] Warning: Failed to save coherence scores: {e}")
-
-                # 8. Save inter-topic distances
-                if results.get('inter_topic_distances'):
-                    try:
-                        db_manager.save_topic_distances(job_id, results['inter_topic_distances'])
-                        print(f"[DATABASE] Saved inter-topic distances")
-                    except Exception as e:
-                        print(f"[DATABASE] Warning: Failed to save topic distances: {e}")
+                        coherence_rows = [
+                            (topic_number, c_v, None)
+                            for topic_number, c_v in enumerate(coherence_data.get('per_topic_coherence', []))
+                        ]
+                        if coherence_rows:
+                            optional.append((
+                                f"coherence scores (overall={coherence_data.get('coherence_score', 0):.4f})",
+                                pool.submit(db_manager.update_topic_coherence_many, job_id, coherence_rows),
+                            ))
+                    if results.get('inter_topic_distances'):
+                        distance_data = results['inter_topic_distances']
+                        distance_rows = [
+                            {'topic_number': topic_number, 'x': x, 'y': y}
+                            for topic_number, (x, y) in enumerate(distance_data.get('coordinates') or [])
+                        ]
+                        if distance_rows:
+                            optional.append((
+                                "inter-topic distances",
+                                pool.submit(db_manager.save_inter_topic_distance, job_id, distance_rows,
+                                            distance_data.get('method', 'umap')),
+                            ))
+
+                    for label, future in optional:
+                        try:
+                            future.result()
+                            print(f"[DATABASE] Saved {label}")
+                        except Exception as e:
+                            print(f"[DATABASE] Warning: Failed to save {label}: {e}")
+
+                # 9. Snapshot the assembled results so later reads are a
+                # single lookup instead of rebuilding the nested JSON
+                db_manager.materialize_results(job_id)
 
                 print(f"[DATABASE] Successfully persisted job {job_id} to PostgreSQL")
             except Exception as e:
                 print(f"[DATABASE] Error persisting to database: {e}")
                 # Don't fail the job if database save fails - results are still in memory
 
-        with modeling_lock:
-            modeling_state.update(
-                {"active": False, "progress": 100, "message": "Modeling completed"}
-            )
+        _update_modeling_state(
+            active=False, progress=100, message="Modeling completed"
+        )
 
         return results
 
@@ -1293,8 +1847,7 @@ def do_topic_modeling(job_id: str, channels: list, algorithm: str, params: dict)
             modeling_jobs[job_id]["status"] = "error"
             modeling_jobs[job_id]["result"] = {"success": False, "error": error_msg}
 
-        with modeling_lock:
-            modeling_state.update({"active": False, "message": f"Error: {error_msg}"})
+        _update_modeling_state(active=False, message=f"Error: {error_msg}")
 
         return {"success": False, "error": error_msg}
 
@@ -1319,7 +1872,7 @@ def modeling_select_data():
         lang_dist = detector.get_language_distribution(comments[:1000])  # Sample
 
         # Get date range
-        timestamps = [m["timestamp"] for m in metadata if m.get("timestamp")]
+        timestamps = [m.timestamp for m in metadata if m.timestamp]
         date_range = {
             "start": min(timestamps) if timestamps else None,
             "end": max(timestamps) if timestamps else None,
@@ -1402,8 +1955,21 @@ def modeling_status(job_id):
 
         job = modeling_jobs[job_id]
 
-    with modeling_lock:
-        state = modeling_state.copy()
+    # Long-poll support: with ?progress_after=<n> the request blocks until
+    # progress moves past n (or the job leaves the active slot), so clients
+    # see updates immediately instead of hammering the endpoint every 500ms
+    progress_after = request.args.get("progress_after", type=int)
+    if progress_after is not None:
+        with modeling_condition:
+            modeling_condition.wait_for(
+                lambda: modeling_state.get("current_job_id") != job_id
+                or not modeling_state.get("active")
+                or modeling_state.get("progress", 0) > progress_after,
+                timeout=10,
+            )
+
+    # Lock-free read: state snapshots are immutable once published
+    state = modeling_state
 
     # If this is the active job, include real-time progress
     if state.get("current_job_id") == job_id:
@@ -1418,16 +1984,41 @@ def modeling_status(job_id):
             }
         )
 
-    # Otherwise return stored job status
-    return jsonify(
-        {
-            "job_id": job_id,
-            "status": job["status"],
-            "progress": 100 if job["status"] == "completed" else 0,
-            "channels": job["channels"],
-            "result": job.get("result") if job["status"] == "completed" else None,
-        }
-    )
+    # Otherwise return stored job status; the embedded result can hold an
+    # ndarray and CommentMeta rows, so serialize it the same way as
+    # modeling_results
+    payload = {
+        "job_id": job_id,
+        "status": job["status"],
+        "progress": 100 if job["status"] == "completed" else 0,
+        "channels": job["channels"],
+        "result": job.get("result") if job["status"] == "completed" else None,
+    }
+    if ORJSON_AVAILABLE:
+        return Response(
+            orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY),
+            mimetype="application/json",
+        )
+    payload["result"] = _plain_result(payload["result"])
+    return jsonify(payload)
+
+
+def _plain_result(result):
+    """Copy a results dict into stdlib-json-safe form (no-orjson fallback).
+
+    document_topics stays an ndarray and metadata holds CommentMeta rows;
+    orjson serializes both natively, but jsonify needs plain types.
+    """
+    if not isinstance(result, dict):
+        return result
+    result = dict(result)
+    dt = result.get("document_topics")
+    if dt is not None and hasattr(dt, "tolist"):
+        result["document_topics"] = dt.tolist()
+    meta = result.get("metadata")
+    if meta and isinstance(meta[0], CommentMeta):
+        result["metadata"] = [asdict(m) for m in meta]
+    return result
 
 
 @app.route("/api/modeling/results/<job_id>")
@@ -1442,7 +2033,15 @@ def modeling_results(job_id):
         if job["status"] != "completed":
             return jsonify({"error": "Job not completed"}), 400
 
-        return jsonify(job["result"])
+        result = job["result"]
+
+    # Serialize outside the lock; document_topics is an ndarray, which orjson
+    # dumps without materializing N x K Python floats
+    if ORJSON_AVAILABLE:
+        payload = orjson.dumps(result, option=orjson.OPT_SERIALIZE_NUMPY)
+        return Response(payload, mimetype="application/json")
+
+    return jsonify(_plain_result(result))
 
 
 @app.route("/api/modeling/jobs")
@@ -1582,39 +2181,40 @@ def list_runs():
             print(f"[DATABASE] Error listing jobs from database: {e}")
             return jsonify({"error": f"Database error: {str(e)}"}), 500
     else:
-        # Fallback to in-memory storage
+        # Fallback to in-memory storage. Jobs enter modeling_jobs in
+        # creation order, so newest-first is plain reverse iteration over
+        # the insertion-ordered dict — no per-request sort, and only the
+        # rows on the requested page are materialized
+        start = (page - 1) * limit
+        end = start + limit
+        total = 0
+        paginated = []
+
         with modeling_jobs_lock:
-            jobs_list = []
-            for job_id, job in modeling_jobs.items():
+            for job_id, job in reversed(modeling_jobs.items()):
                 # Apply filters
                 if status and job["status"] != status:
                     continue
                 if algorithm and job["algorithm"] != algorithm:
                     continue
 
-                jobs_list.append({
-                    "id": job_id,
-                    "job_id": job_id,
-                    "channels": job["channels"],
-                    "algorithm": job["algorithm"],
-                    "status": job["status"],
-                    "created_at": job["created_at"],
-                })
-
-        # Sort by creation time (newest first)
-        jobs_list.sort(key=lambda x: x["created_at"], reverse=True)
-
-        # Apply pagination
-        start = (page - 1) * limit
-        end = start + limit
-        paginated = jobs_list[start:end]
+                if start <= total < end:
+                    paginated.append({
+                        "id": job_id,
+                        "job_id": job_id,
+                        "channels": job["channels"],
+                        "algorithm": job["algorithm"],
+                        "status": job["status"],
+                        "created_at": job["created_at"],
+                    })
+                total += 1
 
         return jsonify({
             "runs": paginated,
-            "total": len(jobs_list),
+            "total": total,
             "page": page,
             "limit": limit,
-            "total_pages": (len(jobs_list) + limit - 1) // limit
+            "total_pages": (total + limit - 1) // limit
         })
 
 
@@ -1651,7 +2251,14 @@ def get_run(run_id):
                     "message": "Run not completed yet"
                 }), 200
 
-            return jsonify(job["result"])
+            result = job["result"]
+
+        # document_topics is an ndarray (see modeling_results)
+        if ORJSON_AVAILABLE:
+            payload = orjson.dumps(result, option=orjson.OPT_SERIALIZE_NUMPY)
+            return Response(payload, mimetype="application/json")
+
+        return jsonify(_plain_result(result))
 
 
 @app.route("/api/runs/<run_id>", methods=["DELETE"])
@@ -1747,11 +2354,12 @@ def export_job_results(job_id):
         if db_manager:
             job_data = db_manager.get_job_results(job_id)
 
-        # Fallback to memory
+        # Fallback to memory; the in-memory result holds an ndarray and
+        # CommentMeta rows, which the stdlib-json exporters can't encode
         if not job_data:
             with modeling_jobs_lock:
                 if job_id in modeling_jobs and modeling_jobs[job_id].get("status") == "completed":
-                    job_data = modeling_jobs[job_id].get("result", {})
+                    job_data = _plain_result(modeling_jobs[job_id].get("result", {}))
 
         if not job_data:
             return jsonify({"error": "Job not found or not completed"}), 404
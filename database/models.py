@@ -6,8 +6,8 @@ providing a Pythonic interface for database operations.
 """
 
 from sqlalchemy import (
-    Column, String, Integer, Float, Text, ARRAY, Boolean, DateTime,
-    ForeignKey, CheckConstraint, UniqueConstraint, Index
+    Column, String, Integer, BigInteger, Float, Text, ARRAY, Boolean,
+    DateTime, ForeignKey, CheckConstraint, UniqueConstraint, Index, text
 )
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship, declarative_base
@@ -26,7 +26,8 @@ class ModelingJob(Base):
     __tablename__ = 'modeling_jobs'
 
     # Primary identifiers
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4,
+                server_default=text('gen_random_uuid()'))
     job_id = Column(String(8), unique=True, nullable=False, index=True)
 
     # Job configuration
@@ -53,6 +54,10 @@ class ModelingJob(Base):
     valid_comments = Column(Integer)
     diversity = Column(Float)
 
+    # Materialized complete-results JSON, written once when a job finishes
+    # persisting; NULL while running or until rebuilt after a rerun
+    results_jsonb = Column(JSONB)
+
     # Relationships
     topics = relationship('Topic', back_populates='job', cascade='all, delete-orphan')
     preprocessing_stats = relationship('PreprocessingStats', back_populates='job', uselist=False, cascade='all, delete-orphan')
@@ -73,7 +78,11 @@ class ModelingJob(Base):
         CheckConstraint('valid_comments IS NULL OR valid_comments >= 0', name='check_valid_comments'),
         CheckConstraint('valid_comments IS NULL OR total_comments IS NULL OR valid_comments <= total_comments', name='check_valid_le_total'),
         CheckConstraint('diversity IS NULL OR (diversity >= 0 AND diversity <= 1)', name='check_diversity'),
-        Index('idx_jobs_status_created', 'status', 'created_at'),
+        # INCLUDE carries the dashboard summary columns in the leaf pages
+        # so status-filtered listings can run as index-only scans
+        Index('idx_jobs_status_created', 'status', 'created_at',
+              postgresql_include=['job_id', 'algorithm', 'num_topics',
+                                  'diversity']),
     )
 
     def to_dict(self) -> Dict[str, Any]:
@@ -105,7 +114,8 @@ class Topic(Base):
     """
     __tablename__ = 'topics'
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4,
+                server_default=text('gen_random_uuid()'))
     job_id = Column(String(8), ForeignKey('modeling_jobs.job_id', ondelete='CASCADE'), nullable=False, index=True)
     topic_number = Column(Integer, nullable=False)
     label = Column(String(100), nullable=False)
@@ -115,13 +125,21 @@ class Topic(Base):
     coherence_score = Column(Float)  # C_v
     umass_score = Column(Float)      # C_umass
 
+    # Top words, rank-ordered: [[word, weight], ...] — already the shape
+    # to_dict serves, so reads are a pass-through with no join or sort
+    words = Column(JSONB)
+
+    # Representative comments, rank-ordered, with their display metadata:
+    # [{text, channel, video_id, video_title, author, likes, timestamp}, ...]
+    representative_comments = Column(JSONB)
+
     # Relationships
     job = relationship('ModelingJob', back_populates='topics')
-    words = relationship('TopicWord', back_populates='topic', cascade='all, delete-orphan')
-    representative_comments = relationship('RepresentativeComment', back_populates='topic', cascade='all, delete-orphan')
     sentiment = relationship('TopicSentiment', back_populates='topic', uselist=False, cascade='all, delete-orphan')
 
-    # Constraints
+    # Constraints. The unique constraint doubles as the composite B-tree
+    # index serving every (job_id, topic_number) lookup and the batched
+    # coherence UPDATE join
     __table_args__ = (
         UniqueConstraint('job_id', 'topic_number', name='uq_job_topic'),
         CheckConstraint('topic_number >= 0', name='check_topic_number'),
@@ -139,82 +157,34 @@ class Topic(Base):
         }
 
         if include_words and self.words:
-            # Sort by rank and convert to [[word, weight], ...] format
-            result['words'] = [[w.word, w.weight] for w in sorted(self.words, key=lambda x: x.rank)]
+            # Already stored rank-ordered in to_dict's [[word, weight], ...] shape
+            result['words'] = self.words
 
         if include_comments and self.representative_comments:
-            # Sort by rank and convert to list of strings
+            # Stored rank-ordered; the API serves just the texts
             result['representative_comments'] = [
-                c.comment_text for c in sorted(self.representative_comments, key=lambda x: x.rank)
+                c['text'] for c in self.representative_comments
             ]
 
         return result
 
 
-class TopicWord(Base):
-    """
-    Stores top words for a topic with their importance weights.
-    """
-    __tablename__ = 'topic_words'
-
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    topic_id = Column(UUID(as_uuid=True), ForeignKey('topics.id', ondelete='CASCADE'), nullable=False, index=True)
-    word = Column(String(100), nullable=False)
-    weight = Column(Float, nullable=False)
-    rank = Column(Integer, nullable=False)
-
-    # Relationships
-    topic = relationship('Topic', back_populates='words')
-
-    # Constraints
-    __table_args__ = (
-        UniqueConstraint('topic_id', 'rank', name='uq_topic_word_rank'),
-        CheckConstraint('weight >= 0', name='check_weight'),
-        CheckConstraint('rank > 0 AND rank <= 20', name='check_rank'),
-    )
-
-
-class RepresentativeComment(Base):
-    """
-    Stores representative comments for a topic.
-    """
-    __tablename__ = 'representative_comments'
-
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    topic_id = Column(UUID(as_uuid=True), ForeignKey('topics.id', ondelete='CASCADE'), nullable=False, index=True)
-    comment_text = Column(Text, nullable=False)
-    rank = Column(Integer, nullable=False)
-
-    # Comment metadata
-    channel = Column(String(255))
-    video_id = Column(String(20))
-    video_title = Column(Text)
-    author = Column(String(255))
-    likes = Column(Integer)
-    timestamp = Column(Integer)  # Unix timestamp
-
-    # Relationships
-    topic = relationship('Topic', back_populates='representative_comments')
-
-    # Constraints
-    __table_args__ = (
-        UniqueConstraint('topic_id', 'rank', name='uq_topic_comment_rank'),
-        CheckConstraint('rank > 0 AND rank <= 5', name='check_comment_rank'),
-        CheckConstraint('likes IS NULL OR likes >= 0', name='check_likes'),
-    )
-
-
 class DocumentTopic(Base):
     """
     Sparse storage of document-topic probabilities (only prob > 0.01).
+
+    One row per document; the significant topics for that document are
+    collapsed into a JSONB list of [topic_number, probability] pairs,
+    which avoids repeating job_id/channel/video_id per (doc, topic) pair.
     """
     __tablename__ = 'document_topics'
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
     job_id = Column(String(8), ForeignKey('modeling_jobs.job_id', ondelete='CASCADE'), nullable=False, index=True)
     document_index = Column(Integer, nullable=False)
-    topic_number = Column(Integer, nullable=False)
-    probability = Column(Float, nullable=False)
+
+    # [[topic_number, probability], ...] sorted by topic_number
+    topics = Column(JSONB, nullable=False)
 
     # Metadata
     channel = Column(String(255))
@@ -226,10 +196,12 @@ class DocumentTopic(Base):
     # Constraints
     __table_args__ = (
         CheckConstraint('document_index >= 0', name='check_doc_index'),
-        CheckConstraint('topic_number >= 0', name='check_topic_num'),
-        CheckConstraint('probability > 0.01 AND probability <= 1', name='check_probability'),
         Index('idx_doc_topics_doc', 'job_id', 'document_index'),
-        Index('idx_doc_topics_topic', 'job_id', 'topic_number'),
+        # Topic-membership lookups go through the GIN index instead of a
+        # per-pair (job_id, topic_number) B-tree
+        Index('idx_doc_topics_gin', 'topics',
+              postgresql_using='gin',
+              postgresql_ops={'topics': 'jsonb_path_ops'}),
     )
 
 
@@ -239,7 +211,8 @@ class TopicSentiment(Base):
     """
     __tablename__ = 'topic_sentiment'
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4,
+                server_default=text('gen_random_uuid()'))
     topic_id = Column(UUID(as_uuid=True), ForeignKey('topics.id', ondelete='CASCADE'), nullable=False, unique=True, index=True)
 
     # Sentiment statistics
@@ -270,7 +243,8 @@ class PreprocessingStats(Base):
     """
     __tablename__ = 'preprocessing_stats'
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4,
+                server_default=text('gen_random_uuid()'))
     job_id = Column(String(8), ForeignKey('modeling_jobs.job_id', ondelete='CASCADE'), nullable=False, unique=True, index=True)
 
     # Document statistics
@@ -309,7 +283,7 @@ class TopicEvolution(Base):
     """
     __tablename__ = 'topic_evolution'
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
     job_id = Column(String(8), ForeignKey('modeling_jobs.job_id', ondelete='CASCADE'), nullable=False, index=True)
     topic_number = Column(Integer, nullable=False)
 
@@ -339,7 +313,7 @@ class InterTopicDistance(Base):
     """
     __tablename__ = 'inter_topic_distance'
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
     job_id = Column(String(8), ForeignKey('modeling_jobs.job_id', ondelete='CASCADE'), nullable=False, index=True)
     topic_number = Column(Integer, nullable=False)
 
@@ -368,7 +342,8 @@ class ModelMetadata(Base):
     """
     __tablename__ = 'model_metadata'
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4,
+                server_default=text('gen_random_uuid()'))
     job_id = Column(String(8), ForeignKey('modeling_jobs.job_id', ondelete='CASCADE'), nullable=False, unique=True, index=True)
 
     # Model information
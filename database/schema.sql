@@ -5,8 +5,8 @@
 -- across server restarts, historical job tracking, and advanced analytics.
 -- ============================================================================
 
--- Enable UUID extension for primary keys
-CREATE EXTENSION IF NOT EXISTS "uuid-ossp";
+-- UUID primary keys use gen_random_uuid(), built into PostgreSQL 13+
+-- (enable pgcrypto on older servers)
 
 -- ============================================================================
 -- TABLE: modeling_jobs
@@ -14,7 +14,7 @@ CREATE EXTENSION IF NOT EXISTS "uuid-ossp";
 -- ============================================================================
 CREATE TABLE IF NOT EXISTS modeling_jobs (
     -- Primary identifiers
-    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
     job_id VARCHAR(8) UNIQUE NOT NULL,  -- Short ID for user-facing reference
 
     -- Job configuration
@@ -39,7 +39,10 @@ CREATE TABLE IF NOT EXISTS modeling_jobs (
     -- Results summary
     total_comments INTEGER CHECK (total_comments >= 0),
     valid_comments INTEGER CHECK (valid_comments >= 0),
-    diversity FLOAT CHECK (diversity >= 0 AND diversity <= 1)
+    diversity FLOAT CHECK (diversity >= 0 AND diversity <= 1),
+
+    -- Materialized complete-results JSON (NULL until the job finishes persisting)
+    results_jsonb JSONB
 );
 
 -- Indexes for efficient queries
@@ -47,7 +50,10 @@ CREATE INDEX IF NOT EXISTS idx_modeling_jobs_job_id ON modeling_jobs(job_id);
 CREATE INDEX IF NOT EXISTS idx_modeling_jobs_created_at ON modeling_jobs(created_at DESC);
 CREATE INDEX IF NOT EXISTS idx_modeling_jobs_status ON modeling_jobs(status);
 CREATE INDEX IF NOT EXISTS idx_modeling_jobs_algorithm ON modeling_jobs(algorithm);
-CREATE INDEX IF NOT EXISTS idx_modeling_jobs_status_created ON modeling_jobs(status, created_at DESC);
+-- INCLUDE carries the dashboard summary columns so status-filtered
+-- listings can run as index-only scans (requires PostgreSQL 11+)
+CREATE INDEX IF NOT EXISTS idx_modeling_jobs_status_created ON modeling_jobs(status, created_at DESC)
+    INCLUDE (job_id, algorithm, num_topics, diversity);
 CREATE INDEX IF NOT EXISTS idx_modeling_jobs_channels ON modeling_jobs USING GIN(channels);  -- For array search
 
 -- ============================================================================
@@ -55,7 +61,7 @@ CREATE INDEX IF NOT EXISTS idx_modeling_jobs_channels ON modeling_jobs USING GIN
 -- Stores individual topics for each job
 -- ============================================================================
 CREATE TABLE IF NOT EXISTS topics (
-    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
     job_id VARCHAR(8) NOT NULL REFERENCES modeling_jobs(job_id) ON DELETE CASCADE,
     topic_number INTEGER NOT NULL CHECK (topic_number >= 0),
     label VARCHAR(100) NOT NULL,  -- e.g., "Topic 0", "Topic 1"
@@ -65,6 +71,13 @@ CREATE TABLE IF NOT EXISTS topics (
     coherence_score FLOAT,  -- C_v coherence score
     umass_score FLOAT,      -- C_umass coherence score
 
+    -- Top words, rank-ordered: [[word, weight], ...]
+    words JSONB,
+
+    -- Representative comments, rank-ordered, with display metadata:
+    -- [{text, channel, video_id, video_title, author, likes, timestamp}, ...]
+    representative_comments JSONB,
+
     -- Constraints
     UNIQUE(job_id, topic_number)
 );
@@ -73,62 +86,18 @@ CREATE TABLE IF NOT EXISTS topics (
 CREATE INDEX IF NOT EXISTS idx_topics_job_id ON topics(job_id);
 CREATE INDEX IF NOT EXISTS idx_topics_coherence ON topics(coherence_score DESC NULLS LAST);
 
--- ============================================================================
--- TABLE: topic_words
--- Stores top words for each topic with their weights
--- ============================================================================
-CREATE TABLE IF NOT EXISTS topic_words (
-    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
-    topic_id UUID NOT NULL REFERENCES topics(id) ON DELETE CASCADE,
-    word VARCHAR(100) NOT NULL,
-    weight FLOAT NOT NULL CHECK (weight >= 0),
-    rank INTEGER NOT NULL CHECK (rank > 0 AND rank <= 20),  -- Top 20 words per topic
-
-    -- Constraints
-    UNIQUE(topic_id, rank)
-);
-
--- Indexes
-CREATE INDEX IF NOT EXISTS idx_topic_words_topic_id ON topic_words(topic_id);
-CREATE INDEX IF NOT EXISTS idx_topic_words_rank ON topic_words(topic_id, rank);
-
--- ============================================================================
--- TABLE: representative_comments
--- Stores representative comments for each topic (up to 5 per topic)
--- ============================================================================
-CREATE TABLE IF NOT EXISTS representative_comments (
-    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
-    topic_id UUID NOT NULL REFERENCES topics(id) ON DELETE CASCADE,
-    comment_text TEXT NOT NULL,
-    rank INTEGER NOT NULL CHECK (rank > 0 AND rank <= 5),  -- Top 5 representative comments
-
-    -- Comment metadata (for display and context)
-    channel VARCHAR(255),
-    video_id VARCHAR(20),
-    video_title TEXT,
-    author VARCHAR(255),
-    likes INTEGER CHECK (likes >= 0),
-    timestamp BIGINT,  -- Unix timestamp
-
-    -- Constraints
-    UNIQUE(topic_id, rank)
-);
-
--- Indexes
-CREATE INDEX IF NOT EXISTS idx_rep_comments_topic_id ON representative_comments(topic_id);
-CREATE INDEX IF NOT EXISTS idx_rep_comments_rank ON representative_comments(topic_id, rank);
-
 -- ============================================================================
 -- TABLE: document_topics
 -- Stores document-topic probability matrix (sparse storage)
 -- Only probabilities > 0.01 are stored to optimize storage
 -- ============================================================================
 CREATE TABLE IF NOT EXISTS document_topics (
-    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    id BIGSERIAL PRIMARY KEY,
     job_id VARCHAR(8) NOT NULL REFERENCES modeling_jobs(job_id) ON DELETE CASCADE,
     document_index INTEGER NOT NULL CHECK (document_index >= 0),
-    topic_number INTEGER NOT NULL CHECK (topic_number >= 0),
-    probability FLOAT NOT NULL CHECK (probability > 0.01 AND probability <= 1),  -- Sparse: only > 0.01
+
+    -- Significant topics for this document: [[topic_number, probability], ...]
+    topics JSONB NOT NULL,
 
     -- Metadata for linking back to original comments
     channel VARCHAR(255),
@@ -138,16 +107,15 @@ CREATE TABLE IF NOT EXISTS document_topics (
 -- Indexes
 CREATE INDEX IF NOT EXISTS idx_doc_topics_job_id ON document_topics(job_id);
 CREATE INDEX IF NOT EXISTS idx_doc_topics_doc_idx ON document_topics(job_id, document_index);
-CREATE INDEX IF NOT EXISTS idx_doc_topics_topic ON document_topics(job_id, topic_number);
--- Partial index for dominant topics (probability > 0.1)
-CREATE INDEX IF NOT EXISTS idx_doc_topics_dominant ON document_topics(job_id, document_index) WHERE probability > 0.1;
+-- GIN index for topic-membership queries against the JSONB pairs
+CREATE INDEX IF NOT EXISTS idx_doc_topics_gin ON document_topics USING gin (topics jsonb_path_ops);
 
 -- ============================================================================
 -- TABLE: topic_sentiment
 -- Stores sentiment analysis results per topic
 -- ============================================================================
 CREATE TABLE IF NOT EXISTS topic_sentiment (
-    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
     topic_id UUID NOT NULL REFERENCES topics(id) ON DELETE CASCADE UNIQUE,
 
     -- Sentiment statistics
@@ -168,7 +136,7 @@ CREATE INDEX IF NOT EXISTS idx_sentiment_topic_id ON topic_sentiment(topic_id);
 -- Stores preprocessing statistics for each job
 -- ============================================================================
 CREATE TABLE IF NOT EXISTS preprocessing_stats (
-    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
     job_id VARCHAR(8) NOT NULL REFERENCES modeling_jobs(job_id) ON DELETE CASCADE UNIQUE,
 
     -- Document statistics
@@ -198,7 +166,7 @@ CREATE INDEX IF NOT EXISTS idx_prep_stats_job_id ON preprocessing_stats(job_id);
 -- Stores topic distribution over time for timeline visualization
 -- ============================================================================
 CREATE TABLE IF NOT EXISTS topic_evolution (
-    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    id BIGSERIAL PRIMARY KEY,
     job_id VARCHAR(8) NOT NULL REFERENCES modeling_jobs(job_id) ON DELETE CASCADE,
     topic_number INTEGER NOT NULL CHECK (topic_number >= 0),
 
@@ -219,7 +187,7 @@ CREATE INDEX IF NOT EXISTS idx_topic_evolution_time ON topic_evolution(job_id, t
 -- Stores 2D coordinates for inter-topic distance visualization
 -- ============================================================================
 CREATE TABLE IF NOT EXISTS inter_topic_distance (
-    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    id BIGSERIAL PRIMARY KEY,
     job_id VARCHAR(8) NOT NULL REFERENCES modeling_jobs(job_id) ON DELETE CASCADE,
     topic_number INTEGER NOT NULL CHECK (topic_number >= 0),
 
@@ -243,7 +211,7 @@ CREATE INDEX IF NOT EXISTS idx_distance_method ON inter_topic_distance(job_id, r
 -- Stores additional model information and metrics
 -- ============================================================================
 CREATE TABLE IF NOT EXISTS model_metadata (
-    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
     job_id VARCHAR(8) NOT NULL REFERENCES modeling_jobs(job_id) ON DELETE CASCADE UNIQUE,
 
     -- Model information
@@ -309,10 +277,10 @@ GROUP BY j.id, j.job_id, j.channels, j.algorithm, j.status, j.created_at, j.star
 -- Function to get the dominant topic for a document
 CREATE OR REPLACE FUNCTION get_dominant_topic(p_job_id VARCHAR(8), p_document_index INTEGER)
 RETURNS INTEGER AS $$
-    SELECT topic_number
-    FROM document_topics
+    SELECT (pair->>0)::INTEGER
+    FROM document_topics, jsonb_array_elements(topics) AS pair
     WHERE job_id = p_job_id AND document_index = p_document_index
-    ORDER BY probability DESC
+    ORDER BY (pair->>1)::FLOAT DESC
     LIMIT 1;
 $$ LANGUAGE SQL STABLE;
 
@@ -327,11 +295,11 @@ BEGIN
     SELECT AVG(topic_entropy) INTO diversity_score
     FROM (
         SELECT
-            topic_id,
-            -SUM(weight * LOG(weight + 1e-10)) as topic_entropy
-        FROM topic_words
-        WHERE topic_id IN (SELECT id FROM topics WHERE job_id = p_job_id)
-        GROUP BY topic_id
+            t.id,
+            -SUM((pair->>1)::FLOAT * LOG((pair->>1)::FLOAT + 1e-10)) as topic_entropy
+        FROM topics t, jsonb_array_elements(t.words) AS pair
+        WHERE t.job_id = p_job_id
+        GROUP BY t.id
     ) sub;
 
     -- Normalize to 0-1 range (assuming max entropy ~5 for typical topics)
@@ -357,8 +325,8 @@ ALTER TABLE preprocessing_stats
 
 COMMENT ON TABLE modeling_jobs IS 'Main table storing metadata for each topic modeling job';
 COMMENT ON TABLE topics IS 'Individual topics discovered in each modeling job';
-COMMENT ON TABLE topic_words IS 'Top words per topic with their weights/importance scores';
-COMMENT ON TABLE representative_comments IS 'Sample comments that best represent each topic';
+COMMENT ON COLUMN topics.words IS 'Rank-ordered [[word, weight], ...] pairs for the topic';
+COMMENT ON COLUMN topics.representative_comments IS 'Rank-ordered representative comments with display metadata';
 COMMENT ON TABLE document_topics IS 'Sparse document-topic probability matrix (only prob > 0.01 stored)';
 COMMENT ON TABLE topic_sentiment IS 'Sentiment analysis results aggregated per topic';
 COMMENT ON TABLE preprocessing_stats IS 'Statistics about text preprocessing and data cleaning';
@@ -370,7 +338,7 @@ COMMENT ON COLUMN modeling_jobs.job_id IS 'Short 8-character ID for user-facing
 COMMENT ON COLUMN modeling_jobs.channels IS 'Array of YouTube channel identifiers (e.g., @handle)';
 COMMENT ON COLUMN modeling_jobs.n_gram_range IS 'Array [min, max] defining n-gram range (e.g., [1,2] for unigrams+bigrams)';
 COMMENT ON COLUMN modeling_jobs.diversity IS 'Topic diversity score 0-1 (higher = more distinct topics)';
-COMMENT ON COLUMN document_topics.probability IS 'Only probabilities > 0.01 are stored (sparse matrix optimization)';
+COMMENT ON COLUMN document_topics.topics IS 'Significant topics as [[topic_number, probability], ...]; only probabilities > 0.01 are stored (sparse matrix optimization)';
 COMMENT ON COLUMN preprocessing_stats.language_distribution IS 'JSONB object mapping language codes to document counts';
 COMMENT ON COLUMN topic_evolution.time_bucket IS 'Aggregated time period (day/week/month depending on granularity)';
 
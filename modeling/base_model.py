@@ -106,6 +106,58 @@ class BaseTopicModel(ABC):
         diversity = unique_words / total_words if total_words > 0 else 0.0
         return diversity
 
+    def get_all_representative_document_indices(self, n: int = 5) -> np.ndarray:
+        """
+        Get representative document indices for every topic at once.
+
+        A single argpartition over the document-topic matrix replaces one
+        full argsort per topic, so the work is O(N*K) rather than
+        O(K*N*log N) for N documents and K topics.
+
+        Args:
+            n: Number of document indices to return per topic
+
+        Returns:
+            Integer array of shape (n, num_topics); column k holds the
+            top-n document indices for topic k, most representative first
+        """
+        if self.document_topics is None or not self.topics:
+            return np.empty((0, 0), dtype=np.intp)
+
+        dt = np.asarray(self.document_topics)
+        n = min(n, dt.shape[0])
+
+        # Unordered top-n per column, then sort just those n rows
+        top_idx = np.argpartition(dt, dt.shape[0] - n, axis=0)[-n:, :]
+        top_probs = np.take_along_axis(dt, top_idx, axis=0)
+        order = np.argsort(-top_probs, axis=0)
+        return np.take_along_axis(top_idx, order, axis=0)
+
+    def get_representative_document_indices(
+        self, topic_id: int, n: int = 5
+    ) -> List[int]:
+        """
+        Get indices of the most representative documents for a given topic.
+
+        Args:
+            topic_id: ID of the topic
+            n: Number of document indices to return
+
+        Returns:
+            List of document indices, most representative first
+        """
+        topic_id = int(topic_id)  # Explicit conversion from potential numpy.int64
+
+        if self.document_topics is None or topic_id >= len(self.topics):
+            return []
+
+        # Get topic probabilities for all documents
+        topic_probs = self.document_topics[:, topic_id]
+
+        # Get indices of top n documents (convert numpy int to python int)
+        top_indices = np.argsort(topic_probs)[-n:][::-1]
+        return [int(i) for i in top_indices]
+
     def get_representative_documents(
         self, documents: List[str], topic_id: int, n: int = 5
     ) -> List[str]:
@@ -120,9 +172,7 @@ class BaseTopicModel(ABC):
         Returns:
             List of most representative documents
         """
-        topic_id = int(topic_id)  # Explicit conversion from potential numpy.int64
-
-        if self.document_topics is None or topic_id >= len(self.topics):
+        if self.document_topics is None:
             return []
 
         # Validate document count matches document_topics rows
@@ -133,19 +183,11 @@ class BaseTopicModel(ABC):
             )
             return []
 
-        # Get topic probabilities for all documents
-        topic_probs = self.document_topics[:, topic_id]
-
-        # Get indices of top n documents
-        top_indices = np.argsort(topic_probs)[-n:][::-1]
-
-        # Return corresponding documents (convert numpy int to python int)
-        result = []
-        for i in top_indices:
-            idx = int(i)
-            if 0 <= idx < len(documents):
-                result.append(documents[idx])
-        return result
+        return [
+            documents[idx]
+            for idx in self.get_representative_document_indices(topic_id, n)
+            if 0 <= idx < len(documents)
+        ]
 
     def get_model_info(self) -> Dict:
         """
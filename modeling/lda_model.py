@@ -1,5 +1,6 @@
 """LDA (Latent Dirichlet Allocation) topic modeling implementation."""
 
+import os
 from typing import Callable, Dict, List, Optional
 
 import numpy as np
@@ -88,7 +89,10 @@ class LDAModel(BaseTopicModel):
             topic_word_prior=self.beta,
             max_iter=self.max_iter,
             random_state=42,
-            n_jobs=-1,  # Use all CPU cores
+            # The E-step fans out to joblib worker processes, so training
+            # already runs outside the server's GIL; leave one core free
+            # so HTTP handlers stay responsive while a job trains
+            n_jobs=max(1, (os.cpu_count() or 2) - 1),
         )
 
         # Fit the model
@@ -1,9 +1,11 @@
 """Text preprocessing pipeline for YouTube comments."""
 
-from typing import List, Optional, Callable
+from typing import List, Optional, Callable, Tuple
 import re
 import unicodedata
 
+import numpy as np
+
 try:
     import spacy
     SPACY_AVAILABLE = True
@@ -13,6 +15,19 @@ except ImportError:
 from .stopwords import get_stopwords
 from .language_detector import LanguageDetector
 
+# Precompiled once at import: clean_text/tokenize run for every comment,
+# and per-call pattern-cache lookups add up over large batches. Possessive
+# quantifiers (++, Python 3.11+) disable backtracking, which otherwise goes
+# quadratic on the long emoji/punctuation runs common in YouTube comments.
+_URL_RE = re.compile(r'https?://\S++|www\.\S++')
+_EMAIL_RE = re.compile(r'(?:^|(?<=\s))[^\s@]++@\S++')
+_MENTION_RE = re.compile(r'@\w++')
+_HASHTAG_RE = re.compile(r'#(\w++)')
+_NUMBER_RE = re.compile(r'\b\d++\b')
+_SPECIAL_RE = re.compile(r"[^\w\s\'-àâäéèêëïîôùûüÿçœæ]", re.UNICODE)
+_SPACES_RE = re.compile(r'\s++')
+_PUNCT_ONLY_RE = re.compile(r'[\W_]++$')
+
 
 class TextPreprocessor:
     """Preprocess YouTube comments for topic modeling."""
@@ -75,8 +90,29 @@ class TextPreprocessor:
         Returns:
             List of processed texts
         """
-        processed = []
+        return self.process_batch_to_array(texts, detect_language)[0].tolist()
+
+    def process_batch_to_array(self, texts: List[str],
+                               detect_language: bool = True) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Process a batch of texts into NumPy arrays.
+
+        Same pipeline as process_batch, but fills a preallocated object
+        array and records each processed text's length on the way, so
+        callers can mask out empty documents with a vectorized compare
+        instead of re-scanning every string.
+
+        Args:
+            texts: List of raw comment texts
+            detect_language: Whether to detect language per comment
+
+        Returns:
+            Tuple (processed, lengths) of aligned arrays: processed texts
+            as an object array and their lengths as int32
+        """
         total = len(texts)
+        processed = np.empty(total, dtype=object)
+        lengths = np.empty(total, dtype=np.int32)
 
         for i, text in enumerate(texts):
             # Progress update
@@ -91,9 +127,10 @@ class TextPreprocessor:
 
             # Process text
             processed_text = self.process(text, detected_language=lang)
-            processed.append(processed_text)
+            processed[i] = processed_text
+            lengths[i] = len(processed_text)
 
-        return processed
+        return processed, lengths
 
     def process(self, text: str, detected_language: Optional[str] = None) -> str:
         """
@@ -119,11 +156,14 @@ class TextPreprocessor:
         if self.use_lemmatization:
             tokens = self.lemmatize(tokens, detected_language)
 
-        # 4. Remove stopwords
-        tokens = self.remove_stopwords(tokens)
-
-        # 5. Filter short tokens
-        tokens = [t for t in tokens if len(t) >= self.min_token_length]
+        # 4+5. Remove stopwords and short tokens in one fused pass instead
+        # of materializing an intermediate list per document
+        stopwords = self.stopwords
+        min_length = self.min_token_length
+        tokens = [
+            t for t in tokens
+            if len(t) >= min_length and t.lower() not in stopwords
+        ]
 
         # Join tokens back into string
         return ' '.join(tokens)
@@ -145,30 +185,29 @@ class TextPreprocessor:
         text = text.lower()
 
         # Remove URLs
-        text = re.sub(r'https?://\S+', '', text)
-        text = re.sub(r'www\.\S+', '', text)
+        text = _URL_RE.sub('', text)
 
         # Remove email addresses
-        text = re.sub(r'\S+@\S+', '', text)
+        text = _EMAIL_RE.sub('', text)
 
         # Remove mentions (@username)
-        text = re.sub(r'@\w+', '', text)
+        text = _MENTION_RE.sub('', text)
 
         # Remove hashtags but keep the text
-        text = re.sub(r'#(\w+)', r'\1', text)
+        text = _HASHTAG_RE.sub(r'\1', text)
 
         # Remove numbers standalone
-        text = re.sub(r'\b\d+\b', '', text)
+        text = _NUMBER_RE.sub('', text)
 
         # Normalize unicode characters (keep accents)
         # text = unicodedata.normalize('NFKD', text)
 
         # Remove special characters but keep letters with accents
         # Keep: a-z, accented letters, spaces, hyphens, apostrophes
-        text = re.sub(r'[^\w\s\'-àâäéèêëïîôùûüÿçœæ]', ' ', text, flags=re.UNICODE)
+        text = _SPECIAL_RE.sub(' ', text)
 
         # Remove multiple spaces
-        text = re.sub(r'\s+', ' ', text)
+        text = _SPACES_RE.sub(' ', text)
 
         # Strip whitespace
         text = text.strip()
@@ -185,16 +224,9 @@ class TextPreprocessor:
         Returns:
             List of tokens
         """
-        # Simple whitespace tokenization
-        tokens = text.split()
-
-        # Remove empty tokens
-        tokens = [t for t in tokens if t]
-
-        # Remove tokens that are just punctuation
-        tokens = [t for t in tokens if not re.match(r'^[\W_]+$', t)]
-
-        return tokens
+        # Simple whitespace tokenization (split() never yields empty
+        # tokens), dropping punctuation-only tokens in the same pass
+        return [t for t in text.split() if not _PUNCT_ONLY_RE.match(t)]
 
     def lemmatize(self, tokens: List[str], detected_language: Optional[str] = None) -> List[str]:
         """
@@ -16,7 +16,7 @@ Usage:
 import os
 import time
 from database.db_manager import DatabaseManager
-from database.models import ModelingJob, Topic, TopicWord
+from database.models import ModelingJob, Topic
 
 # Colors for terminal output
 GREEN = '\033[92m'